@@ -6,18 +6,31 @@ This module provides the CLI for managing sync configurations and the sync servi
 
 import os
 import sys
+import copy
 import json
 import logging
 import argparse
+import shutil
 import signal
+import threading
 import psutil
 import subprocess
 from pathlib import Path
 from typing import Optional, Dict, Any
 import time
-import multiprocessing
+from contextlib import contextmanager
 
-from .sync import one_way, bidirectional, monitor
+from .sync import read_remote_config, SYNC_EXCLUDE_FILES, MONITOR_EXCLUDE_FILES
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import orjson  # Optional, faster JSON decoding
+except ImportError:
+    orjson = None
 
 # Configure logging
 class SimpleFormatter(logging.Formatter):
@@ -27,15 +40,17 @@ class SimpleFormatter(logging.Formatter):
             return record.getMessage()
         return f"{record.levelname}: {record.getMessage()}"
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-
 # Create console handler with simple format
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(SimpleFormatter())
 
+# Logs live in their own directory so writing them does not wake the
+# manager's watcher on ~/.rclone
+LOG_DIR = os.path.expanduser("~/.rclone/logs")
+os.makedirs(LOG_DIR, exist_ok=True)
+
 # Create file handler with detailed format
-file_handler = logging.FileHandler(os.path.expanduser("~/.rclone/scs.log"))
+file_handler = logging.FileHandler(os.path.join(LOG_DIR, "scs.log"))
 file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 
 # Configure root logger
@@ -44,38 +59,77 @@ root_logger.setLevel(logging.INFO)
 root_logger.addHandler(console_handler)
 root_logger.addHandler(file_handler)
 
-# Configure our package logger
+# Our package logger propagates to the root handlers above
 logger = logging.getLogger("secure_cloud_syncer.cli")
 logger.setLevel(logging.INFO)
-logger.propagate = False  # Prevent propagation to root logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
 
 CONFIG_FILE = os.path.expanduser("~/.rclone/scs_config.json")
 PID_FILE = os.path.expanduser("~/.rclone/scs_manager.pid")
 
+# Parsed config keyed on (st_mtime_ns, st_size) of CONFIG_FILE, so repeated
+# loads within one command only cost a stat() while the file is unchanged
+_config_cache: Optional[tuple] = None
+
 def load_config() -> Dict[str, Any]:
     """Load the configuration file."""
-    if not os.path.exists(CONFIG_FILE):
+    global _config_cache
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return {"syncs": {}}
+    except OSError as e:
+        logger.error(f"Error loading configuration: {e}")
         return {"syncs": {}}
     
+    key = (st.st_mtime_ns, st.st_size)
+    if _config_cache is not None and _config_cache[0] == key:
+        # Callers mutate the returned dict, so never hand out the cached one
+        return copy.deepcopy(_config_cache[1])
+    
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        with open(CONFIG_FILE, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson else json.loads(data)
     except Exception as e:
         logger.error(f"Error loading configuration: {e}")
         return {"syncs": {}}
+    
+    _config_cache = (key, config)
+    return copy.deepcopy(config)
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save the configuration file."""
+    global _config_cache
     try:
         os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=2)
+        # Drop the cached copy; the next load re-stats and re-parses
+        _config_cache = None
     except Exception as e:
         logger.error(f"Error saving configuration: {e}")
         sys.exit(1)
 
+@contextmanager
+def config_lock():
+    """
+    Hold an exclusive lock for a read-modify-write of the configuration file.
+    
+    Prevents concurrent CLI commands from losing each other's updates. On
+    platforms without fcntl this is a no-op.
+    """
+    if fcntl is None:
+        yield
+        return
+    
+    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
+    with open(f"{CONFIG_FILE}.lock", 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 def get_running_syncs() -> Dict[str, int]:
     """Get a dictionary of running sync processes."""
     if not os.path.exists(PID_FILE):
@@ -148,9 +202,8 @@ def add_sync(name, local_dir, remote_dir, mode="bidirectional", exclude_resource
     # For drive.file scope, ensure path is under rclone root
     if remote_name == 'gdrive':
         try:
-            result = subprocess.run(['rclone', 'config', 'show', remote_name], 
-                                  capture_output=True, text=True)
-            if 'scope = drive.file' in result.stdout:
+            remote_config = read_remote_config(remote_name, fallback=True) or {}
+            if remote_config.get('scope') == 'drive.file':
                 config = load_config()
                 rclone_root = config.get('rclone_root', 'secureCloudSyncer')
                 if not remote_path.startswith(f"{rclone_root}/"):
@@ -164,8 +217,7 @@ def add_sync(name, local_dir, remote_dir, mode="bidirectional", exclude_resource
     # Verify rclone configuration
     try:
         # Check if remote exists
-        result = subprocess.run(['rclone', 'listremotes'], capture_output=True, text=True, check=True)
-        if f"{remote_name}:" not in result.stdout:
+        if read_remote_config(remote_name, fallback=True) is None:
             logger.error(f"Remote '{remote_name}' not found in rclone configuration")
             sys.exit(1)
         
@@ -174,14 +226,14 @@ def add_sync(name, local_dir, remote_dir, mode="bidirectional", exclude_resource
         test_content = "This is a test file created by Secure Cloud Syncer"
         test_file_path = os.path.join(local_dir, test_file)
         
-        logger.debug(f"Creating test file: {test_file_path}")
+        logger.debug("Creating test file: %s", test_file_path)
         # Create test file locally
         with open(test_file_path, 'w') as f:
             f.write(test_content)
         
         # Try to copy the test file to remote
         remote_path = remote_path.rstrip('/')  # Remove trailing slash
-        logger.debug(f"Copying test file to remote: {remote_name}:{remote_path}/{test_file}")
+        logger.debug("Copying test file to remote: %s:%s/%s", remote_name, remote_path, test_file)
         result = subprocess.run(['rclone', 'copy', test_file_path, f"{remote_name}:{remote_path}"], 
                               capture_output=True, text=True)
         
@@ -200,47 +252,48 @@ def add_sync(name, local_dir, remote_dir, mode="bidirectional", exclude_resource
     finally:
         # Clean up test file from remote
         remote_path = remote_path.rstrip('/')  # Remove trailing slash
-        logger.debug(f"Cleaning up test file from remote: {remote_name}:{remote_path}/{test_file}")
+        logger.debug("Cleaning up test file from remote: %s:%s/%s", remote_name, remote_path, test_file)
         try:
             # Use rclone deletefile with the correct path format
             result = subprocess.run(['rclone', 'deletefile', f"{remote_name}:{remote_path}/{test_file}"], 
                                   capture_output=True, text=True)
             if result.returncode == 0:
-                logger.debug(f"Successfully cleaned up test file from remote: {remote_path}/{test_file}")
+                logger.debug("Successfully cleaned up test file from remote: %s/%s", remote_path, test_file)
             else:
                 logger.warning(f"Failed to clean up test file from remote: {result.stderr}")
         except Exception as e:
             logger.warning(f"Error during remote cleanup: {e}")
         
         # Clean up local test file
-        logger.debug(f"Cleaning up local test file: {test_file_path}")
+        logger.debug("Cleaning up local test file: %s", test_file_path)
         try:
             if os.path.exists(test_file_path):
                 os.remove(test_file_path)
-                logger.debug(f"Successfully cleaned up local test file: {test_file_path}")
+                logger.debug("Successfully cleaned up local test file: %s", test_file_path)
             else:
                 logger.warning(f"Local test file not found: {test_file_path}")
         except Exception as e:
             logger.warning(f"Error during local cleanup: {e}")
     
-    config = load_config()
-    
-    if name in config["syncs"]:
-        logger.error(f"Sync configuration '{name}' already exists")
-        sys.exit(1)
-    
-    # Add the sync configuration with status
-    config["syncs"][name] = {
-        "name": name,
-        "local_dir": local_dir,
-        "remote_dir": remote_dir,
-        "mode": mode,  # 'bidirectional' or 'upload'
-        "exclude_resource_forks": exclude_resource_forks,
-        "debounce_time": debounce_time,
-        "status": "active"  # Can be: active, paused
-    }
-    
-    save_config(config)
+    with config_lock():
+        config = load_config()
+        
+        if name in config["syncs"]:
+            logger.error(f"Sync configuration '{name}' already exists")
+            sys.exit(1)
+        
+        # Add the sync configuration with status
+        config["syncs"][name] = {
+            "name": name,
+            "local_dir": local_dir,
+            "remote_dir": remote_dir,
+            "mode": mode,  # 'bidirectional' or 'upload'
+            "exclude_resource_forks": exclude_resource_forks,
+            "debounce_time": debounce_time,
+            "status": "active"  # Can be: active, paused
+        }
+        
+        save_config(config)
     logger.info(f"Added sync configuration '{name}'")
     logger.info(f"Local directory: {local_dir}")
     logger.info(f"Remote directory: {remote_dir}")
@@ -316,14 +369,15 @@ def list_syncs():
 
 def remove_sync(name):
     """Remove a sync configuration."""
-    config = load_config()
-    
-    if name not in config["syncs"]:
-        logger.error(f"Sync configuration '{name}' does not exist")
-        sys.exit(1)
-    
-    del config["syncs"][name]
-    save_config(config)
+    with config_lock():
+        config = load_config()
+        
+        if name not in config["syncs"]:
+            logger.error(f"Sync configuration '{name}' does not exist")
+            sys.exit(1)
+        
+        del config["syncs"][name]
+        save_config(config)
     logger.info(f"Removed sync configuration '{name}'")
 
 def start_sync(args) -> None:
@@ -386,27 +440,44 @@ def restart_sync(args) -> None:
     # Start the sync
     start_sync(args)
 
-def is_service_running():
-    """Check if the sync service is running."""
-    if not os.path.exists(PID_FILE):
-        return False
-    
+# (timestamp, result) of the last is_service_running() check
+_service_status_cache: Optional[tuple] = None
+SERVICE_STATUS_TTL = 0.5
+
+def _read_service_pid() -> Optional[int]:
+    """Read the service PID from the PID file, or None if unavailable."""
     try:
         with open(PID_FILE, 'r') as f:
-            pid = int(f.read().strip())
-        
-        # Check if process exists
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def is_service_running():
+    """Check if the sync service is running."""
+    global _service_status_cache
+    now = time.monotonic()
+    if _service_status_cache is not None and now - _service_status_cache[0] < SERVICE_STATUS_TTL:
+        return _service_status_cache[1]
+    
+    pid = _read_service_pid()
+    running = False
+    if pid is not None:
         try:
             if os.name == 'nt':  # Windows
-                import psutil
-                return psutil.pid_exists(pid)
+                running = psutil.pid_exists(pid)
             else:  # Unix
                 os.kill(pid, 0)
-                return True
-        except (OSError, psutil.NoSuchProcess):
-            return False
-    except Exception:
-        return False
+                running = True
+        except (OSError, psutil.Error):
+            running = False
+    
+    _service_status_cache = (now, running)
+    return running
+
+def _invalidate_service_status():
+    """Forget the cached service status after starting or stopping the service."""
+    global _service_status_cache
+    _service_status_cache = None
 
 def start_service():
     """Start the sync service."""
@@ -426,9 +497,14 @@ def start_service():
                            stderr=subprocess.DEVNULL,
                            creationflags=subprocess.CREATE_NO_WINDOW)
         else:  # Unix
+            # Detach from the terminal's session so its SIGHUP/SIGINT don't reach
+            # the service
             subprocess.Popen([sys.executable, "-m", "secure_cloud_syncer.manager"],
+                           stdin=subprocess.DEVNULL,
                            stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL)
+                           stderr=subprocess.DEVNULL,
+                           start_new_session=True)
+        _invalidate_service_status()
         logger.info("Sync service started")
     except Exception as e:
         logger.error(f"Error starting sync service: {e}")
@@ -460,6 +536,7 @@ def stop_service():
             
             # Wait for the service to stop
             for _ in range(10):  # Wait up to 10 seconds
+                _invalidate_service_status()
                 if not is_service_running():
                     break
                 time.sleep(1)
@@ -467,6 +544,7 @@ def stop_service():
                 # If service didn't stop, force kill
                 os.kill(pid, 9)  # SIGKILL
         
+        _invalidate_service_status()
         logger.info("Sync service stopped")
     except Exception as e:
         logger.error(f"Error stopping sync service: {e}")
@@ -547,12 +625,13 @@ def setup_rclone():
         }.get(dir_enc, 'true')
         
         # Save encryption settings to config for future reference
-        config = load_config()
-        config['encryption_settings'] = {
-            'filename_encryption': filename_encryption,
-            'directory_name_encryption': directory_name_encryption
-        }
-        save_config(config)
+        with config_lock():
+            config = load_config()
+            config['encryption_settings'] = {
+                'filename_encryption': filename_encryption,
+                'directory_name_encryption': directory_name_encryption
+            }
+            save_config(config)
         
         # Get encryption password with confirmation
         print("\n=== Encryption Settings ===")
@@ -670,9 +749,10 @@ def setup_rclone():
                 print(f"✅ Created root folder '{rclone_root}' in your {provider['name']}")
                 
                 # Save the rclone root folder to config for future use
-                config = load_config()
-                config['rclone_root'] = rclone_root
-                save_config(config)
+                with config_lock():
+                    config = load_config()
+                    config['rclone_root'] = rclone_root
+                    save_config(config)
             
             # Create encrypted remote
             result = subprocess.run(['rclone', 'config', 'create', provider['crypt_remote'], 'crypt',
@@ -700,8 +780,10 @@ def setup_rclone():
                                      capture_output=True, text=True)
                         print(f"\n✅ {provider['name']} configuration successful!")
                 else:
-                    # For full access, verify basic connectivity
-                    result = subprocess.run(['rclone', 'ls', f"{provider['remote']}:"], 
+                    # For full access, verify basic connectivity. List only the
+                    # top-level directories; 'rclone ls' would walk the whole remote
+                    # and stream every file through the pipe
+                    result = subprocess.run(['rclone', 'lsd', '--max-depth', '1', f"{provider['remote']}:"], 
                                           capture_output=True, text=True)
                     if result.returncode == 0:
                         print(f"\n✅ {provider['name']} configuration successful!")
@@ -781,10 +863,35 @@ def cleanup_setup():
     else:
         print("ℹ️ Service is not running")
     
+    # Query the configured remotes once so we only spawn rclone for remotes that exist
+    try:
+        result = subprocess.run(['rclone', 'listremotes'], capture_output=True, text=True)
+        configured_remotes = {line.rstrip(':') for line in result.stdout.split()}
+    except Exception as e:
+        print(f"ℹ️ Error listing rclone remotes: {e}")
+        configured_remotes = set()
+    
+    # Remove Google Drive folder if it exists. This must run before the
+    # remotes are deleted, since it needs the gdrive remote to check its scope
+    print("\nRemoving Google Drive folder...")
+    if 'gdrive' in configured_remotes:
+        try:
+            remote_config = read_remote_config('gdrive', fallback=True) or {}
+            if remote_config.get('scope') == 'drive.file':
+                # Try to remove the folder
+                subprocess.run(['rclone', 'purge', f'gdrive:{rclone_root}'], 
+                             capture_output=True, text=True)
+                print(f"✅ Removed folder '{rclone_root}' from Google Drive")
+        except Exception as e:
+            print(f"ℹ️ Error removing Google Drive folder: {e}")
+    
     # Remove rclone remotes
     print("\nRemoving rclone remotes...")
     remotes = ['gdrive', 'gdrive-crypt', 'onedrive', 'onedrive-crypt', 'dropbox', 'dropbox-crypt']
     for remote in remotes:
+        if remote not in configured_remotes:
+            print(f"ℹ️ Remote '{remote}' not found")
+            continue
         try:
             result = subprocess.run(['rclone', 'config', 'delete', remote], 
                                   capture_output=True, text=True)
@@ -795,73 +902,95 @@ def cleanup_setup():
         except Exception as e:
             print(f"ℹ️ Error removing remote '{remote}': {e}")
     
-    # Remove Google Drive folder if it exists
-    print("\nRemoving Google Drive folder...")
-    try:
-        result = subprocess.run(['rclone', 'config', 'show', 'gdrive'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0 and 'scope = drive.file' in result.stdout:
-            # Try to remove the folder
-            subprocess.run(['rclone', 'purge', f'gdrive:{rclone_root}'], 
-                         capture_output=True, text=True)
-            print(f"✅ Removed folder '{rclone_root}' from Google Drive")
-    except Exception as e:
-        print(f"ℹ️ Error removing Google Drive folder: {e}")
-    
     # Remove all Secure Cloud Syncer related files
     print("\nRemoving configuration files and logs...")
     rclone_dir = os.path.expanduser("~/.rclone")
     files_to_remove = [
         CONFIG_FILE,
         PID_FILE,
-        os.path.join(rclone_dir, "scs.log"),
         os.path.join(rclone_dir, "scs_stop_flag"),
-        os.path.join(rclone_dir, "scs_manager.log"),
-        os.path.join(rclone_dir, "scs_manager.error.log")
+        *(os.path.join(rclone_dir, name) for name in SYNC_EXCLUDE_FILES + MONITOR_EXCLUDE_FILES),
+        f"{CONFIG_FILE}.lock"
     ]
     
+    # List the directory once instead of probing each path separately
+    try:
+        with os.scandir(rclone_dir) as entries:
+            present = {entry.name for entry in entries if not entry.is_dir()}
+    except FileNotFoundError:
+        present = set()
+    except OSError as e:
+        print(f"ℹ️ Error accessing .rclone directory: {e}")
+        present = set()
+    
     # Remove specific files
     for file in files_to_remove:
+        name = os.path.basename(file)
+        if name not in present:
+            print(f"ℹ️ {name} not found")
+            continue
         try:
-            if os.path.exists(file):
-                os.remove(file)
-                print(f"✅ Removed {os.path.basename(file)}")
-            else:
-                print(f"ℹ️ {os.path.basename(file)} not found")
-        except Exception as e:
-            print(f"ℹ️ Error removing {os.path.basename(file)}: {e}")
+            os.unlink(file)
+            present.discard(name)
+            print(f"✅ Removed {name}")
+        except FileNotFoundError:
+            print(f"ℹ️ {name} not found")
+        except OSError as e:
+            print(f"ℹ️ Error removing {name}: {e}")
+    
+    # Remove the log directory. Close our own log files in it first, since
+    # Windows cannot delete a file that is still open
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, logging.FileHandler):
+            root_logger.removeHandler(handler)
+            handler.close()
+    try:
+        shutil.rmtree(LOG_DIR)
+        print(f"✅ Removed log directory: {LOG_DIR}")
+    except FileNotFoundError:
+        print("ℹ️ Log directory not found")
+    except OSError as e:
+        print(f"ℹ️ Error removing log directory: {e}")
     
-    # Remove all scs_ log files from .rclone folder
+    # Remove the record of which directories bisync has listings for
+    bisync_state_dir = os.path.join(rclone_dir, "scs_bisync")
     try:
-        for file in os.listdir(rclone_dir):
-            if file.startswith("scs_") and file.endswith(".log"):
-                file_path = os.path.join(rclone_dir, file)
-                try:
-                    os.remove(file_path)
-                    print(f"✅ Removed log file: {file}")
-                except Exception as e:
-                    print(f"ℹ️ Error removing log file {file}: {e}")
-    except Exception as e:
-        print(f"ℹ️ Error accessing .rclone directory: {e}")
+        shutil.rmtree(bisync_state_dir)
+        print(f"✅ Removed bisync state directory: {bisync_state_dir}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"ℹ️ Error removing bisync state directory: {e}")
+    
+    # Remove scs_ log files left in .rclone by older versions
+    for file in sorted(present):
+        if file.startswith("scs_") and file.endswith(".log"):
+            file_path = os.path.join(rclone_dir, file)
+            try:
+                os.unlink(file_path)
+                print(f"✅ Removed log file: {file}")
+            except OSError as e:
+                print(f"ℹ️ Error removing log file {file}: {e}")
     
     print("\n✅ Cleanup completed!")
     print("You can now run 'scs setup' again to reconfigure the tool.")
 
 def pause_sync(name):
     """Pause a sync configuration."""
-    config = load_config()
-    
-    if name not in config["syncs"]:
-        logger.error(f"Sync configuration '{name}' does not exist")
-        sys.exit(1)
-    
-    if config["syncs"][name]["status"] == "paused":
-        logger.info(f"Sync configuration '{name}' is already paused")
-        return
-    
-    # Update status first
-    config["syncs"][name]["status"] = "paused"
-    save_config(config)
+    with config_lock():
+        config = load_config()
+        
+        if name not in config["syncs"]:
+            logger.error(f"Sync configuration '{name}' does not exist")
+            sys.exit(1)
+        
+        if config["syncs"][name]["status"] == "paused":
+            logger.info(f"Sync configuration '{name}' is already paused")
+            return
+        
+        # Update status first
+        config["syncs"][name]["status"] = "paused"
+        save_config(config)
     
     # Then tell the service to reload config
     if is_service_running():
@@ -878,19 +1007,20 @@ def pause_sync(name):
 
 def resume_sync(name):
     """Resume a paused sync configuration."""
-    config = load_config()
-    
-    if name not in config["syncs"]:
-        logger.error(f"Sync configuration '{name}' does not exist")
-        sys.exit(1)
-    
-    if config["syncs"][name]["status"] == "active":
-        logger.info(f"Sync configuration '{name}' is already active")
-        return
-    
-    # Update status first
-    config["syncs"][name]["status"] = "active"
-    save_config(config)
+    with config_lock():
+        config = load_config()
+        
+        if name not in config["syncs"]:
+            logger.error(f"Sync configuration '{name}' does not exist")
+            sys.exit(1)
+        
+        if config["syncs"][name]["status"] == "active":
+            logger.info(f"Sync configuration '{name}' is already active")
+            return
+        
+        # Update status first
+        config["syncs"][name]["status"] = "active"
+        save_config(config)
     
     # Then tell the service to reload config
     if not is_service_running():
@@ -928,39 +1058,69 @@ def uninstall():
     print("\n✅ Uninstallation completed!")
     print("All configurations and the package have been removed.")
 
+def _tail_lines(f, lines: int, block_size: int = 8192) -> bytes:
+    """Return the last `lines` lines of a binary file, reading backwards in blocks."""
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    pos = end
+    data = b''
+    while pos > 0 and data.count(b'\n') <= lines:
+        read_size = min(block_size, pos)
+        pos -= read_size
+        f.seek(pos)
+        data = f.read(read_size) + data
+    f.seek(end)
+    if lines <= 0:
+        return b''
+    return b''.join(data.splitlines(keepends=True)[-lines:])
+
+def _follow_log(f, log_file: str) -> None:
+    """Stream bytes appended to an open log file until interrupted."""
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    
+    changed = threading.Event()
+    
+    class LogHandler(FileSystemEventHandler):
+        def on_modified(self, event):
+            if event.src_path == log_file:
+                changed.set()
+    
+    observer = Observer()
+    observer.schedule(LogHandler(), os.path.dirname(log_file), recursive=False)
+    observer.start()
+    try:
+        while True:
+            changed.wait()
+            changed.clear()
+            chunk = f.read()
+            if chunk:
+                sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observer.stop()
+        observer.join()
+
 def show_service_logs(follow=False, lines=50):
     """Show the sync service logs."""
-    log_file = os.path.expanduser("~/.rclone/scs.log")
+    log_file = os.path.join(LOG_DIR, "scs.log")
     if not os.path.exists(log_file):
         print("No log file found. The service might not have started yet.")
         return
     
     try:
-        if follow:
-            # Use tail -f to follow the log file
-            subprocess.run(['tail', '-f', '-n', str(lines), log_file])
-        else:
-            # Just show the last n lines
-            subprocess.run(['tail', '-n', str(lines), log_file])
+        with open(log_file, 'rb') as f:
+            # Show the last n lines, leaving the file positioned at the end
+            sys.stdout.buffer.write(_tail_lines(f, lines))
+            sys.stdout.buffer.flush()
+            if follow:
+                _follow_log(f, log_file)
     except Exception as e:
         print(f"Error showing logs: {e}")
 
-def main():
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(description='Secure Cloud Syncer CLI')
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
-    
-    # Setup command
-    setup_parser = subparsers.add_parser('setup', help='Set up rclone with Google Drive')
-    
-    # Cleanup command
-    subparsers.add_parser('cleanup', help='Remove all configurations and created folders from setup')
-    
-    # Uninstall command
-    subparsers.add_parser('uninstall', help='Uninstall the package and remove all configurations')
-    
-    # Add command
-    add_parser = subparsers.add_parser('add', help='Add a new sync configuration')
+def _build_add_parser(add_parser):
     add_parser.add_argument('name', help='Name of the sync configuration')
     add_parser.add_argument('local_path', help='Local path to sync')
     add_parser.add_argument('--remote-dir', required=True, help='Remote directory path')
@@ -973,24 +1133,17 @@ def main():
                           help='Exclude macOS resource fork files (._*)')
     add_parser.add_argument('--debounce-time', type=int, default=5,
                           help='Time in seconds to wait before syncing after changes (default: 5)')
-    
-    # List command
-    subparsers.add_parser('list', help='List all sync configurations')
-    
-    # Remove command
-    remove_parser = subparsers.add_parser('remove', help='Remove a sync configuration')
+
+def _build_remove_parser(remove_parser):
     remove_parser.add_argument('name', help='Name of the sync configuration to remove')
-    
-    # Pause command
-    pause_parser = subparsers.add_parser('pause', help='Pause a sync configuration')
+
+def _build_pause_parser(pause_parser):
     pause_parser.add_argument('name', help='Name of the sync configuration to pause')
-    
-    # Resume command
-    resume_parser = subparsers.add_parser('resume', help='Resume a paused sync configuration')
+
+def _build_resume_parser(resume_parser):
     resume_parser.add_argument('name', help='Name of the sync configuration to resume')
-    
-    # Service commands
-    service_parser = subparsers.add_parser('service', help='Manage the sync service')
+
+def _build_service_parser(service_parser):
     service_subparsers = service_parser.add_subparsers(dest='service_command', help='Service commands')
     
     # Service start command
@@ -1009,6 +1162,45 @@ def main():
     logs_parser = service_subparsers.add_parser('logs', help='Show the sync service logs')
     logs_parser.add_argument('--follow', '-f', action='store_true', help='Follow the log output')
     logs_parser.add_argument('--lines', '-n', type=int, default=50, help='Number of lines to show (default: 50)')
+
+# Command name -> (help text, function adding the command's arguments)
+COMMANDS = {
+    'setup': ('Set up rclone with Google Drive', None),
+    'cleanup': ('Remove all configurations and created folders from setup', None),
+    'uninstall': ('Uninstall the package and remove all configurations', None),
+    'add': ('Add a new sync configuration', _build_add_parser),
+    'list': ('List all sync configurations', None),
+    'remove': ('Remove a sync configuration', _build_remove_parser),
+    'pause': ('Pause a sync configuration', _build_pause_parser),
+    'resume': ('Resume a paused sync configuration', _build_resume_parser),
+    'service': ('Manage the sync service', _build_service_parser),
+}
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser.
+    
+    If a known command is given, only that command's subparser is built, which
+    keeps start-up cheap. Otherwise all commands are registered so that help
+    and error messages list every command.
+    """
+    parser = argparse.ArgumentParser(description='Secure Cloud Syncer CLI')
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+    
+    for name, (help_text, build) in COMMANDS.items():
+        if command is not None and name != command:
+            continue
+        command_parser = subparsers.add_parser(name, help=help_text)
+        command_parser.set_defaults(command_parser=command_parser)
+        if build is not None:
+            build(command_parser)
+    
+    return parser
+
+def main():
+    """Main entry point for the CLI."""
+    command = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] in COMMANDS else None
+    parser = build_parser(command)
     
     # Parse arguments
     args = parser.parse_args()
@@ -1036,7 +1228,7 @@ def main():
         resume_sync(args.name)
     elif args.command == 'service':
         if args.service_command is None:
-            service_parser.print_help()
+            args.command_parser.print_help()
             sys.exit(1)
         
         if args.service_command == 'start':
@@ -8,29 +8,53 @@ import os
 import sys
 import json
 import time
+import hashlib
+import queue
+import atexit
 import signal
 import logging
 import threading
-import multiprocessing
 import subprocess
 import psutil
 from pathlib import Path
 from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener, MemoryHandler
 
-from .sync import one_way, bidirectional, monitor
-print(f"DEBUG: monitor module: {monitor}")  # This will show us what we're actually importing
+from .sync import monitor
+
+try:
+    import orjson  # Optional, faster JSON encoding and decoding
+except ImportError:
+    orjson = None
+
+CONFIG_FILE = os.path.expanduser("~/.rclone/scs_config.json")
+SOCKET_FILE = os.path.expanduser("~/.rclone/scs.sock")
+PID_FILE = os.path.expanduser("~/.rclone/scs_manager.pid")
+CONFIG_DIR = os.path.dirname(CONFIG_FILE)
+PID_DIR = os.path.dirname(PID_FILE)
+STOP_FLAG_FILE = os.path.expanduser("~/.rclone/scs_stop_flag")
+RELOAD_FLAG_FILE = os.path.expanduser("~/.rclone/scs_reload_flag")
+
+# Logs are kept out of ~/.rclone itself, which the config watcher observes
+LOG_DIR = os.path.join(CONFIG_DIR, "logs")
+MANAGER_LOG = os.path.join(LOG_DIR, "scs_manager.log")
+ERROR_LOG = os.path.join(LOG_DIR, "scs_manager.error.log")
 
 def setup_logging():
     """
     Set up logging configuration for the manager process.
     This should be called once at startup.
+    
+    Records are handed to a queue and written by a background listener
+    thread, so logging calls never block the caller on console or file I/O.
     """
+    global log_listener, log_buffer
+    
     # Create log directory if it doesn't exist
-    log_dir = os.path.expanduser("~/.rclone")
-    os.makedirs(log_dir, exist_ok=True)
+    os.makedirs(LOG_DIR, exist_ok=True)
     
     # Configure root logger
     root_logger = logging.getLogger()
@@ -46,26 +70,45 @@ def setup_logging():
     # Add console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
     
     # Add rotating file handler for all logs
     rotating_handler = RotatingFileHandler(
-        os.path.join(log_dir, "scs_manager.log"),
+        MANAGER_LOG,
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
     )
     rotating_handler.setFormatter(formatter)
-    root_logger.addHandler(rotating_handler)
+    
+    # Batch writes to the main log; errors flush immediately and the
+    # scheduler flushes the rest every LOG_FLUSH_INTERVAL seconds
+    log_buffer = MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=rotating_handler,
+        flushOnClose=True
+    )
     
     # Add error file handler
     error_handler = RotatingFileHandler(
-        os.path.join(log_dir, "scs_manager.error.log"),
+        ERROR_LOG,
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(error_formatter)
-    root_logger.addHandler(error_handler)
+    
+    # Route all records through a queue to a background writer thread
+    log_queue = queue.SimpleQueue() if hasattr(queue, 'SimpleQueue') else queue.Queue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(
+        log_queue, console_handler, log_buffer, error_handler,
+        respect_handler_level=True
+    )
+    log_listener.start()
+    # Flush pending records on interpreter exit, including sys.exit().
+    # atexit runs in reverse order: drain the queue, then the buffer
+    atexit.register(log_buffer.close)
+    atexit.register(log_listener.stop)
     
     # Get the logger for this module
     logger = logging.getLogger("secure_cloud_syncer.manager")
@@ -73,46 +116,177 @@ def setup_logging():
     return logger
 
 # Set up logging at module level
+log_listener: Optional[QueueListener] = None
+log_buffer: Optional[MemoryHandler] = None
 logger = setup_logging()
 
-CONFIG_FILE = os.path.expanduser("~/.rclone/scs_config.json")
-SOCKET_FILE = os.path.expanduser("~/.rclone/scs.sock")
-PID_FILE = os.path.expanduser("~/.rclone/scs_manager.pid")
-STOP_FLAG_FILE = os.path.expanduser("~/.rclone/scs_stop_flag")
+# Seconds between task health checks
+HEALTH_CHECK_INTERVAL = 60
+# Seconds between flushes of buffered log records to scs_manager.log
+LOG_FLUSH_INTERVAL = 30
+# Seconds between watchdog checks that the PID file still exists
+PID_FILE_CHECK_INTERVAL = 300
+# Slack for comparing a process start time with the PID file mtime;
+# psutil derives start times from the boot time, which has 1s resolution
+PID_START_TOLERANCE = 2
+
+# Filesystems where native change notifications are unreliable or unavailable
+NETWORK_FILESYSTEMS = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb2', 'smb3', 'afpfs', 'webdav', 'fuse.sshfs', '9p'}
+
+def get_filesystem_type(path):
+    """
+    Get the filesystem type of the mount containing a path.
+    
+    Args:
+        path (str): Path to look up
+        
+    Returns:
+        str: The filesystem type, or None if it cannot be determined
+    """
+    path = os.path.realpath(path)
+    best_match = None
+    try:
+        for partition in psutil.disk_partitions(all=True):
+            mountpoint = partition.mountpoint
+            if path == mountpoint or path.startswith(mountpoint.rstrip(os.sep) + os.sep):
+                if best_match is None or len(mountpoint) > len(best_match.mountpoint):
+                    best_match = partition
+    except Exception as e:
+        logger.warning(f"Could not determine filesystem type for {path}: {e}")
+        return None
+    return best_match.fstype.lower() if best_match else None
+
+def create_observer(path):
+    """
+    Create a watchdog observer suited to the filesystem holding a path.
+    
+    Local filesystems use the native backend (inotify, FSEvents or
+    ReadDirectoryChangesW). Network filesystems don't deliver native events,
+    so they get a PollingObserver with a wide interval, configurable through
+    the SCS_WATCH_INTERVAL environment variable (seconds, default 30).
+    
+    Args:
+        path (str): Directory that will be watched
+        
+    Returns:
+        Observer: The observer instance
+    """
+    fstype = get_filesystem_type(path)
+    if fstype in NETWORK_FILESYSTEMS:
+        from watchdog.observers.polling import PollingObserver
+        try:
+            interval = float(os.environ.get('SCS_WATCH_INTERVAL', 30))
+        except ValueError:
+            interval = 30
+        logger.info(f"{path} is on a {fstype} filesystem, polling every {interval} seconds")
+        return PollingObserver(timeout=interval)
+    return Observer()
 
 class ConfigWatcher(FileSystemEventHandler):
-    """Watch for changes to the config file."""
-    def __init__(self, manager):
+    """Watch for changes to the config file and for the reload flag file."""
+    def __init__(self, manager, debounce_time=2.0):
         self.manager = manager
-        self.last_modified = 0
+        self.debounce_time = debounce_time
+        self._timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
     
     def on_modified(self, event):
         if event.src_path == CONFIG_FILE:
-            # Debounce config changes
-            current_time = time.time()
-            if current_time - self.last_modified > 1:  # 1 second debounce
-                self.last_modified = current_time
-                logger.info(f"Config file modified: {event.src_path}")
-                self.manager.reload_config()
+            self._schedule_reload()
+    
+    def on_created(self, event):
+        if event.src_path == CONFIG_FILE:
+            self._schedule_reload()
+        elif event.src_path == RELOAD_FLAG_FILE:
+            # Reload requested without SIGHUP (Windows)
+            try:
+                os.remove(RELOAD_FLAG_FILE)
+            except OSError as e:
+                logger.error(f"Error removing reload flag: {e}")
+            self._schedule_reload()
+    
+    def on_moved(self, event):
+        # Editors that save by writing a temp file and renaming it over the
+        # original produce a move event rather than a modification
+        if event.dest_path == CONFIG_FILE:
+            self._schedule_reload()
+    
+    def _schedule_reload(self):
+        # Trailing-edge debounce: editors emit bursts of events, so reload
+        # once after the file has been quiet for debounce_time
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_time, self._reload)
+            self._timer.name = "scs-config-reload"
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _reload(self):
+        with self._timer_lock:
+            self._timer = None
+        logger.info(f"Reloading config file: {CONFIG_FILE}")
+        self.manager.reload_config()
+    
+    def request_reload(self):
+        """Reload the configuration on the debounce timer thread."""
+        self._schedule_reload()
+    
+    def cancel(self):
+        """Cancel any pending reload."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+def config_digest(config):
+    """
+    Compute a digest identifying a task configuration.
+    
+    Args:
+        config (dict): Task configuration
+        
+    Returns:
+        bytes: 16-byte digest that is equal for equal configurations
+    """
+    if orjson:
+        encoded = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(config, sort_keys=True, separators=(',', ':')).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
 
 class SyncTask:
     """
     Represents a sync task with its configuration and process.
     """
-    def __init__(self, config):
+    # Config fields that require the monitor to be rebuilt when they change;
+    # anything else (e.g. debounce_time) can be applied to the running task
+    RESTART_FIELDS = ('local_dir', 'remote_dir', 'mode', 'direction', 'exclude_resource_forks')
+    # Seconds to wait before restarting a task that stopped unexpectedly
+    RESTART_DELAY = 30
+    # Shared by all tasks rather than looked up for each one
+    logger = logging.getLogger("secure_cloud_syncer.manager.task")
+    
+    def __init__(self, config, on_change=None):
         """
         Initialize a sync task.
         
         Args:
             config (dict): Task configuration
+            on_change (callable): Called with the task whenever its state changes
         """
         self.config = config
+        self.on_change = on_change
+        self.config_hash = config_digest(config)
         self.observer = None
         self.start_time = None
         self.last_error = None
         self.error_count = 0
         self.restart_count = 0
-        self.logger = logging.getLogger("secure_cloud_syncer.manager.task")
+        self.stopped = False
+        self._next_restart_time = None
+        # Serializes stop() against restarts from the health check
+        self.lock = threading.Lock()
     
     def start(self):
         """
@@ -121,8 +295,14 @@ class SyncTask:
         Returns:
             bool: True if the task started successfully, False otherwise
         """
+        started = self._start()
+        self._notify()
+        return started
+    
+    def _start(self):
         try:
-            self.logger.info(f"Starting task with config: {self.config}")
+            # Lazy %-formatting: the config dict is only repr'd if INFO is enabled
+            self.logger.info("Starting task with config: %s", self.config)
             
             # Validate required fields
             required_fields = ['local_dir', 'remote_dir']
@@ -139,6 +319,7 @@ class SyncTask:
             direction = self.config.get('direction', 'bidirectional')
             
             self.logger.info(f"Starting monitor for {local_dir}")
+            # start_monitoring returns a started observer or raises
             self.observer = monitor.start_monitoring(
                 local_dir=local_dir,
                 remote_dir=remote_dir,
@@ -147,14 +328,9 @@ class SyncTask:
                 direction=direction
             )
             
-            if not isinstance(self.observer, Observer):
-                self.logger.error("Failed to create observer")
-                return False
-            
             self.start_time = time.time()
             self.last_error = None
             self.error_count = 0
-            self.restart_count = 0
             
             self.logger.info(f"Task started successfully")
             return True
@@ -172,19 +348,142 @@ class SyncTask:
         Returns:
             bool: True if the task was stopped successfully, False otherwise
         """
+        with self.lock:
+            # Finalize even if the observer already died: its handler may
+            # still have a sync pending or running
+            self.request_stop()
+            return self.finalize_stop()
+    
+    def request_stop(self):
+        """
+        Signal the task to stop without waiting for it to finish.
+        
+        Returns:
+            bool: True if a stop was requested, False if the task was not running
+        """
+        self.stopped = True
         try:
             if self.observer and self.observer.is_alive():
                 self.logger.info("Stopping task")
                 self.observer.stop()
-                self.observer.join()
-                self.observer = None
-                self.logger.info("Task stopped successfully")
                 return True
             return False
         except Exception as e:
             self.logger.error(f"Error stopping task: {e}", exc_info=True)
             return False
     
+    def finalize_stop(self, deadline=None):
+        """
+        Wait for a task that was asked to stop to finish.
+        
+        Syncs run on the handler's debounce timer threads rather than the
+        observer thread, so this also waits for a running sync to finish;
+        otherwise a restarted task could start rclone on the same directory
+        while the old run still holds bisync's lock.
+        
+        Args:
+            deadline (float): time.monotonic() value to stop waiting at, or None to wait indefinitely
+            
+        Returns:
+            bool: True if the task has stopped, False otherwise
+        """
+        if self.observer is None:
+            return True
+        try:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            self.observer.join(timeout)
+            if self.observer.is_alive():
+                self.logger.warning("Task did not stop before the deadline")
+                return False
+            
+            # No more events can arrive, so drop a sync still waiting out its
+            # debounce period and wait for one that is running
+            handler = getattr(self.observer, 'event_handler', None)
+            if handler is not None:
+                handler.stop()
+                timeout = None if deadline is None else max(0, deadline - time.monotonic())
+                if not handler.wait_for_sync(timeout):
+                    self.logger.warning("Sync did not finish before the deadline")
+                    return False
+            self.observer = None
+            self.logger.info("Task stopped successfully")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error stopping task: {e}", exc_info=True)
+            return False
+        finally:
+            self._notify()
+    
+    def check_health(self):
+        """
+        Check that the task is running and restart it if it died.
+        
+        A dead task is not restarted immediately: the first check schedules a
+        restart RESTART_DELAY seconds ahead and returns, and a later check
+        performs it. Checks therefore never sleep.
+        
+        Returns:
+            bool: True if the task is healthy, False otherwise
+        """
+        if self.stopped or self.is_running():
+            self._next_restart_time = None
+            return True
+        
+        now = time.time()
+        if self._next_restart_time is None:
+            self.logger.warning(f"Task is not running, restarting in {self.RESTART_DELAY} seconds")
+            self._next_restart_time = now + self.RESTART_DELAY
+            self._notify()
+            return False
+        if now < self._next_restart_time:
+            return False
+        
+        with self.lock:
+            if self.stopped:
+                return True
+            # The observer died, but its handler may still be syncing. Don't
+            # wait for rclone here: checks run on the scheduler thread, so
+            # try again on a later check instead
+            if not self.finalize_stop(deadline=time.monotonic()):
+                self.logger.info(f"Sync still running, retrying restart in {self.RESTART_DELAY} seconds")
+                self._next_restart_time = now + self.RESTART_DELAY
+                return False
+            self._next_restart_time = None
+            self.restart_count += 1
+            self.logger.info(f"Restarting task (restart #{self.restart_count})")
+            started = self.start()
+            if started and self.stopped:
+                # The manager shut down while the task was being restarted
+                self.request_stop()
+                self.finalize_stop(deadline=time.monotonic() + 5)
+                return False
+            return started
+    
+    def needs_restart(self, config):
+        """
+        Check if a new configuration requires the task to be restarted.
+        
+        Args:
+            config (dict): New task configuration
+            
+        Returns:
+            bool: True if a restart-relevant field changed, False otherwise
+        """
+        return any(self.config.get(field) != config.get(field) for field in self.RESTART_FIELDS)
+    
+    def update_config(self, config):
+        """
+        Apply a configuration change that does not require a restart.
+        
+        Args:
+            config (dict): New task configuration
+        """
+        self.config = config
+        self.config_hash = config_digest(config)
+        handler = getattr(self.observer, 'event_handler', None)
+        if handler is not None:
+            handler.debounce_time = config.get('debounce_time', 5)
+    
     def is_running(self):
         """
         Check if the task is running.
@@ -194,6 +493,13 @@ class SyncTask:
         """
         return self.observer is not None and self.observer.is_alive()
     
+    def _notify(self):
+        if self.on_change is not None:
+            try:
+                self.on_change(self)
+            except Exception as e:
+                self.logger.error(f"Error in task state callback: {e}", exc_info=True)
+    
     def get_status(self):
         """
         Get the current status of the task.
@@ -216,11 +522,18 @@ class SyncManager:
         self.tasks: Dict[str, SyncTask] = {}
         self.running = False
         self.config_watcher = ConfigWatcher(self)
-        self.observer = Observer()
+        self.observer = create_observer(CONFIG_DIR)
+        # Guards self.tasks; only held briefly, never across task starts/stops
         self.lock = threading.Lock()
-        self.health_check_thread = None
-        self.watchdog_thread = None
-        self.last_activity = time.time()
+        self._reload_lock = threading.Lock()
+        self.scheduler_thread = None
+        self._stop_event = threading.Event()
+        # Task name -> status, updated on task state changes so get_status
+        # never has to take self.lock (held while tasks do their initial sync)
+        self._status_snapshot: Dict[str, Dict[str, Any]] = {}
+        self._status_lock = threading.Lock()
+        # blake2b digest of the config file contents at the last successful reload
+        self._config_hash: Optional[bytes] = None
     
     def initialize(self):
         """Initialize the sync manager (setup without starting)."""
@@ -229,16 +542,15 @@ class SyncManager:
             return
         
         # Start watching the config file
-        self.observer.schedule(self.config_watcher, os.path.dirname(CONFIG_FILE), recursive=False)
+        self.observer.schedule(self.config_watcher, CONFIG_DIR, recursive=False)
+        self.observer.name = "scs-config-observer"
         self.observer.start()
         
-        # Start health check thread
-        self.health_check_thread = threading.Thread(target=self._health_check_loop, daemon=True)
-        self.health_check_thread.start()
-        
-        # Start watchdog thread
-        self.watchdog_thread = threading.Thread(target=self._watchdog_loop, daemon=True)
-        self.watchdog_thread.start()
+        # Start the thread running health checks and the watchdog
+        self._stop_event.clear()
+        self.scheduler_thread = threading.Thread(target=self._scheduler_loop,
+                                                 name="scs-scheduler", daemon=True)
+        self.scheduler_thread.start()
         
         logger.info("Sync manager initialized")
     
@@ -268,87 +580,108 @@ class SyncManager:
         except Exception as e:
             logger.error(f"Error creating stop flag: {e}")
         
+        self._shutdown()
+        logger.info("Sync manager stopped")
+    
+    def _shutdown(self):
+        """Stop the config observer, all tasks and the background threads."""
         # Stop watching the config file
         self.observer.stop()
         self.observer.join()
+        self.config_watcher.cancel()
         
-        # Stop all tasks
+        # Take the tasks out of the map and mark the manager stopped in one
+        # step, so a task that is still starting stops itself rather than
+        # being added afterwards
         with self.lock:
-            for task in self.tasks.values():
-                task.stop()
-            self.tasks.clear()
+            self.running = False
+            tasks, self.tasks = list(self.tasks.values()), {}
         
-        # Stop watchdog threads
-        self.running = False  # This will stop the watchdog loops
+        # Stop all tasks: signal every task first, then wait for them against a
+        # shared deadline so teardown overlaps instead of running serially
+        for task in tasks:
+            task.request_stop()
+        deadline = time.monotonic() + 5
+        for task in tasks:
+            task.finalize_stop(deadline)
+        # After the stops, which still report their state changes
+        with self._status_lock:
+            self._status_snapshot.clear()
         
-        # Wait for watchdog threads to finish
-        if self.health_check_thread and self.health_check_thread.is_alive():
-            self.health_check_thread.join(timeout=5)
-        if self.watchdog_thread and self.watchdog_thread.is_alive():
-            self.watchdog_thread.join(timeout=5)
+        # Stop the scheduler thread
+        self._stop_event.set()
         
-        logger.info("Sync manager stopped")
+        # Wait for the scheduler to finish (it may be the caller when the
+        # watchdog restarts the service)
+        thread = self.scheduler_thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
     
-    def _watchdog_loop(self):
-        """Watchdog thread to ensure the service stays alive."""
-        while self.running:  # This will stop when self.running is set to False
-            try:
-                # Check if the main process is still running
-                if not os.path.exists(PID_FILE):
-                    # Check if this was an intentional stop
-                    if os.path.exists(STOP_FLAG_FILE):
-                        logger.info("Service was intentionally stopped, not restarting")
-                        try:
-                            os.remove(STOP_FLAG_FILE)
-                        except Exception as e:
-                            logger.error(f"Error removing stop flag: {e}")
-                        break
-                    else:
-                        logger.error("PID file not found, service may have crashed")
-                        self._restart_service()
-                    break
-                
-                with open(PID_FILE, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                try:
-                    if os.name == 'nt':  # Windows
-                        import psutil
-                        if not psutil.pid_exists(pid):
-                            raise OSError("Process not found")
-                    else:  # Unix
-                        os.kill(pid, 0)  # Check if process exists
-                except OSError:
-                    # Check if this was an intentional stop
-                    if os.path.exists(STOP_FLAG_FILE):
-                        logger.info("Service was intentionally stopped, not restarting")
-                        try:
-                            os.remove(STOP_FLAG_FILE)
-                        except Exception as e:
-                            logger.error(f"Error removing stop flag: {e}")
-                        break
-                    else:
-                        logger.error("Service process not found, restarting...")
-                        self._restart_service()
-                    break
-                
-                # Update last activity time
-                self.last_activity = time.time()
-                
-                time.sleep(30)  # Check every 30 seconds
-            except Exception as e:
-                logger.error(f"Error in watchdog loop: {e}")
-                time.sleep(5)  # Wait before retrying
+    def _scheduler_loop(self):
+        """Run the health checks, the watchdog and log flushes on a single thread.
+        
+        All three are short periodic jobs, so one thread keeps a deadline
+        for each and sleeps on the stop event until the next one is due.
+        """
+        now = time.monotonic()
+        next_health_check = now
+        next_watchdog = now
+        next_log_flush = now + LOG_FLUSH_INTERVAL
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            if next_watchdog is not None and now >= next_watchdog:
+                next_watchdog = self._watchdog_tick()
+                if next_watchdog is not None:
+                    next_watchdog += time.monotonic()
+            if now >= next_health_check:
+                self._health_check_tick()
+                next_health_check = time.monotonic() + HEALTH_CHECK_INTERVAL
+            if now >= next_log_flush:
+                if log_buffer is not None:
+                    log_buffer.flush()
+                next_log_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+            
+            deadline = min(next_health_check, next_log_flush)
+            if next_watchdog is not None:
+                deadline = min(deadline, next_watchdog)
+            self._stop_event.wait(max(0, deadline - time.monotonic()))
+    
+    def _watchdog_tick(self) -> Optional[float]:
+        """Check that the service's PID file still exists.
+        
+        The watchdog runs inside the service process, so the process itself
+        is always alive here; the PID file only changes when the service is
+        stopped or replaced, so it is checked every PID_FILE_CHECK_INTERVAL.
+        
+        Returns:
+            Optional[float]: Seconds until the next check, or None to stop checking
+        """
+        try:
+            if not os.path.exists(PID_FILE):
+                # Check if this was an intentional stop
+                if os.path.exists(STOP_FLAG_FILE):
+                    logger.info("Service was intentionally stopped, not restarting")
+                    try:
+                        os.remove(STOP_FLAG_FILE)
+                    except Exception as e:
+                        logger.error(f"Error removing stop flag: {e}")
+                else:
+                    logger.error("PID file not found, service may have crashed")
+                    self._restart_service()
+                return None
+            
+            return PID_FILE_CHECK_INTERVAL
+        except Exception as e:
+            logger.error(f"Error in watchdog check: {e}")
+            return 5  # Wait before retrying
     
     def _restart_service(self):
         """Restart the service process."""
         try:
-            # Remove stale PID file
-            if os.path.exists(PID_FILE):
-                os.remove(PID_FILE)
-            
-            # Start new service process
             if os.name == 'nt':  # Windows
+                # Remove stale PID file
+                remove_pid()
+                
                 # Use pythonw.exe to run without console window
                 python_exe = os.path.join(os.path.dirname(sys.executable), 'pythonw.exe')
                 if not os.path.exists(python_exe):
@@ -357,21 +690,41 @@ class SyncManager:
                                stdout=subprocess.DEVNULL,
                                stderr=subprocess.DEVNULL,
                                creationflags=subprocess.CREATE_NO_WINDOW)
+                logger.info("Service restarted by watchdog")
             else:  # Unix
-                subprocess.Popen([sys.executable, "-m", "secure_cloud_syncer.manager"],
-                               stdout=sys.stdout,
-                               stderr=sys.stderr)
-            logger.info("Service restarted by watchdog")
+                # Replace this process in place: keeps a single PID for the
+                # service manager and avoids forking a copy of this heap
+                logger.info("Restarting service in place")
+                self._shutdown()
+                remove_pid()
+                if log_listener is not None:
+                    log_listener.stop()  # Flush queued records before exec
+                if log_buffer is not None:
+                    log_buffer.flush()
+                try:
+                    os.execv(sys.executable, [sys.executable, "-m", "secure_cloud_syncer.manager"])
+                except OSError:
+                    if log_listener is not None:
+                        log_listener.start()
+                    raise
         except Exception as e:
             logger.error(f"Failed to restart service: {e}")
     
-    def _health_check_loop(self):
-        """Periodically check the health of all tasks."""
-        while self.running:
-            with self.lock:
-                for task in self.tasks.values():
-                    task.check_health()
-            time.sleep(60)  # Check every minute
+    def _health_check_tick(self):
+        """Check the health of all tasks."""
+        # Snapshot the tasks so slow restarts don't hold the lock and
+        # block reload_config or get_status
+        with self.lock:
+            tasks = list(self.tasks.values())
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks)),
+                                    thread_name_prefix="scs-health") as executor:
+                futures = [executor.submit(task.check_health) for task in tasks]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Error checking task health: {e}", exc_info=True)
     
     def reload_config(self):
         """Reload the configuration and update tasks."""
@@ -379,73 +732,174 @@ class SyncManager:
             logger.warning("Sync manager is not running, skipping config reload")
             return
         
+        # Reloads can be triggered by SIGHUP and the config watcher at once
+        with self._reload_lock:
+            self._reload_config()
+    
+    def request_reload(self):
+        """
+        Ask for the configuration to be reloaded without waiting for it.
+        
+        Safe to call from a signal handler: the reload runs on the config
+        watcher's timer thread, so it never waits on a lock the interrupted
+        thread may hold.
+        """
+        self.config_watcher.request_reload()
+    
+    def _reload_config(self):
         try:
-            # Load new config
-            if not os.path.exists(CONFIG_FILE):
+            # Load new config. The file is always read: mtime and size can
+            # stay the same across an edit (e.g. pause/resume swapping
+            # "paused" for "active" within one timestamp tick)
+            try:
+                with open(CONFIG_FILE, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = None
+            if data is None:
+                config_hash = None
                 new_config = {"syncs": {}}
                 logger.warning(f"Config file not found: {CONFIG_FILE}")
             else:
-                with open(CONFIG_FILE, 'r') as f:
-                    new_config = json.load(f)
+                # Writes that only bump the mtime (e.g. touch) leave the
+                # contents unchanged, so skip parsing and the per-task diff
+                config_hash = hashlib.blake2b(data, digest_size=16).digest()
+                if config_hash == self._config_hash:
+                    logger.info("Config contents unchanged, skipping reload")
+                    return
+                new_config = orjson.loads(data) if orjson else json.loads(data)
                 logger.info(f"Loaded config with {len(new_config['syncs'])} syncs")
             
+            # Work out what changed against a snapshot of the tasks, so
+            # get_status and the health checks are not blocked behind the
+            # slow task stops and starts below
             with self.lock:
-                # Stop removed tasks
-                for name in list(self.tasks.keys()):
-                    if name not in new_config["syncs"]:
-                        logger.info(f"Removing task {name}")
-                        self.tasks[name].stop()
-                        del self.tasks[name]
-                
-                # Update existing tasks
-                for name, config in new_config["syncs"].items():
-                    if name in self.tasks:
-                        # Check if config changed or status changed to paused
-                        if self.tasks[name].config != config:
-                            logger.info(f"Updating task {name} with new config")
-                            self.tasks[name].stop()
-                            if config.get('status') != 'paused':
-                                self.tasks[name] = SyncTask(config)
-                                self.tasks[name].start()
-                            else:
-                                logger.info(f"Task {name} is paused, not starting")
+                current = dict(self.tasks)
+            to_stop = []
+            to_start = {}
+            
+            for name, task in current.items():
+                if name not in new_config["syncs"]:
+                    logger.info(f"Removing task {name}")
+                    to_stop.append((name, task))
+            
+            for name, config in new_config["syncs"].items():
+                task = current.get(name)
+                if task is not None:
+                    # Check if config changed or status changed to paused
+                    if task.config_hash == config_digest(config):
+                        continue
+                    if (config.get('status') != 'paused' and task.is_running()
+                            and not task.needs_restart(config)):
+                        logger.info(f"Updating task {name} in place")
+                        task.update_config(config)
+                        continue
+                    logger.info(f"Updating task {name} with new config")
+                    to_stop.append((name, task))
+                    if config.get('status') != 'paused':
+                        to_start[name] = config
+                    else:
+                        logger.info(f"Task {name} is paused, not starting")
+                else:
+                    # Start new task only if not paused
+                    if config.get('status') != 'paused':
+                        logger.info(f"Starting new task {name}")
+                        to_start[name] = config
                     else:
-                        # Start new task only if not paused
-                        if config.get('status') != 'paused':
-                            logger.info(f"Starting new task {name}")
-                            self.tasks[name] = SyncTask(config)
-                            self.tasks[name].start()
-                        else:
-                            logger.info(f"New task {name} is paused, not starting")
+                        logger.info(f"New task {name} is paused, not starting")
+            
+            # Tasks are independent, so stop and start them concurrently
+            self._run_parallel(task.stop for _, task in to_stop)
+            with self.lock:
+                for name, task in to_stop:
+                    if self.tasks.get(name) is task:
+                        del self.tasks[name]
+                with self._status_lock:
+                    for name, _ in to_stop:
+                        self._status_snapshot.pop(name, None)
+            
+            self._run_parallel(lambda name=name, config=config: self._start_task(name, config)
+                               for name, config in to_start.items())
+            
+            self._config_hash = config_hash
             
             logger.info("Configuration reloaded successfully")
         except Exception as e:
             logger.error(f"Error reloading configuration: {e}", exc_info=True)
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get the status of all tasks."""
+    def _start_task(self, name, config):
+        """Create and start a task, then add it to the task map."""
+        task = self._create_task(name, config)
+        task.start()
         with self.lock:
-            return {
-                name: task.get_status()
-                for name, task in self.tasks.items()
-            }
+            if self.running:
+                self.tasks[name] = task
+                return
+        # The manager was stopped while the task was starting
+        task.stop()
+    
+    def _run_parallel(self, calls):
+        """
+        Run callables on a bounded thread pool and wait for all of them.
+        
+        Args:
+            calls (iterable): Callables taking no arguments
+        """
+        calls = list(calls)
+        if not calls:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(calls)),
+                                thread_name_prefix="scs-reload") as executor:
+            futures = [executor.submit(call) for call in calls]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error updating task: {e}", exc_info=True)
+    
+    def _create_task(self, name, config):
+        """Create a sync task that reports its state changes to the status snapshot."""
+        return SyncTask(config, on_change=lambda task: self._record_status(name, task))
+    
+    def _record_status(self, name, task):
+        """Store a task's current status in the snapshot."""
+        status = task.get_status()
+        with self._status_lock:
+            # Ignore late updates from a task that has since been replaced
+            if self.tasks.get(name, task) is task:
+                self._status_snapshot[name] = status
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get the status of all tasks from the snapshot kept up to date on state changes."""
+        now = time.time()
+        with self._status_lock:
+            snapshot = {name: dict(status) for name, status in self._status_snapshot.items()}
+        for status in snapshot.values():
+            status['uptime'] = now - status['start_time'] if status['start_time'] else None
+        return snapshot
 
 def save_pid():
     """Save the process ID to the PID file."""
+    pid = os.getpid()
+    # Write to a per-process temporary file in the same directory so readers
+    # never see a partially written PID file. Creating it with its final mode
+    # avoids a separate chmod
+    temp_pid_file = f"{PID_FILE}.{pid}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
     try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(PID_FILE), exist_ok=True)
-        
-        # Use a temporary file to ensure atomic write
-        temp_pid_file = f"{PID_FILE}.tmp"
-        with open(temp_pid_file, 'w') as f:
-            f.write(str(os.getpid()))
-        
-        # Atomically rename the temporary file
-        os.rename(temp_pid_file, PID_FILE)
+        try:
+            fd = os.open(temp_pid_file, flags, 0o644)
+        except FileNotFoundError:
+            # Create directory if it doesn't exist
+            os.makedirs(PID_DIR, exist_ok=True)
+            fd = os.open(temp_pid_file, flags, 0o644)
+        try:
+            os.write(fd, f"{pid}\n".encode())
+        finally:
+            os.close(fd)
         
-        # Set proper permissions
-        os.chmod(PID_FILE, 0o644)
+        # Atomically replace the PID file, even if one already exists
+        os.replace(temp_pid_file, PID_FILE)
     except Exception as e:
         logger.error(f"Error saving PID: {e}")
         sys.exit(1)
@@ -453,29 +907,24 @@ def save_pid():
 def remove_pid():
     """Remove the PID file."""
     try:
-        if os.path.exists(PID_FILE):
-            # Use a temporary file to ensure atomic removal
-            temp_pid_file = f"{PID_FILE}.tmp"
-            if os.path.exists(temp_pid_file):
-                os.remove(temp_pid_file)
-            os.rename(PID_FILE, temp_pid_file)
-            os.remove(temp_pid_file)
-    except Exception as e:
+        os.unlink(PID_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
         logger.error(f"Error removing PID file: {e}")
 
 def check_pid_file():
     """Check if the PID file is valid and the process is running."""
-    if not os.path.exists(PID_FILE):
-        return False
-    
     try:
         with open(PID_FILE, 'r') as f:
             pid = int(f.read().strip())
+            written = os.fstat(f.fileno()).st_mtime
         
-        # Check if process exists and is our service
+        # The service writes its PID file after it starts, so a process that
+        # started later reused the PID. Comparing start times needs a single
+        # /proc read instead of reading both the name and the cmdline
         try:
-            process = psutil.Process(pid)
-            if process.name().startswith(('python', 'pythonw')) and 'secure_cloud_syncer.manager' in ' '.join(process.cmdline()):
+            if psutil.Process(pid).create_time() <= written + PID_START_TOLERANCE:
                 return True
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
@@ -487,34 +936,64 @@ def check_pid_file():
         remove_pid()
         return False
 
+def _iter_manager_pids():
+    """
+    Find the PIDs of Python processes running the manager module.
+    
+    On Linux only /proc/<pid>/cmdline is read for each process, and it is
+    matched as raw bytes before anything is decoded; psutil.process_iter
+    would also read each process's stat and status files.
+    
+    Yields:
+        int: PID of a manager process
+    """
+    if not os.path.isdir('/proc'):
+        for proc in psutil.process_iter(['name', 'cmdline']):
+            name = proc.info['name']
+            cmdline = proc.info['cmdline']
+            if (name and name.lower().startswith(('python', 'pythonw')) and cmdline
+                    and 'secure_cloud_syncer.manager' in ' '.join(cmdline)):
+                yield proc.pid
+        return
+    
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/cmdline", 'rb') as f:
+                cmdline = f.read(4096)
+        except OSError:
+            continue
+        if b'secure_cloud_syncer.manager' not in cmdline:
+            continue
+        executable = os.path.basename(cmdline.split(b'\0', 1)[0]).lower()
+        if executable.startswith(b'python'):
+            yield int(entry.name)
+
 def check_and_cleanup_duplicate_managers():
     """Check for and clean up any duplicate manager processes."""
     try:
-        # Get all Python processes
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        for pid in _iter_manager_pids():
+            # Skip our own process
+            if pid == os.getpid():
+                continue
             try:
-                # Check if this is a Python process running our manager
-                if proc.info['name'] and proc.info['name'].lower().startswith(('python', 'pythonw')):
-                    cmdline = proc.info['cmdline']
-                    if cmdline and 'secure_cloud_syncer.manager' in ' '.join(cmdline):
-                        # Skip our own process
-                        if proc.pid == os.getpid():
-                            continue
-                        
-                        logger.warning(f"Found duplicate manager process with PID {proc.pid}")
-                        # Try to terminate gracefully
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=5)
-                        except psutil.TimeoutExpired:
-                            logger.warning(f"Force killing duplicate process {proc.pid}")
-                            proc.kill()
-                        
-                        # Remove any stale PID files
-                        if os.path.exists(PID_FILE):
-                            os.remove(PID_FILE)
-                        if os.path.exists(STOP_FLAG_FILE):
-                            os.remove(STOP_FLAG_FILE)
+                proc = psutil.Process(pid)
+                logger.warning(f"Found duplicate manager process with PID {pid}")
+                # Try to terminate gracefully
+                proc.terminate()
+                try:
+                    proc.wait(timeout=5)
+                except psutil.TimeoutExpired:
+                    logger.warning(f"Force killing duplicate process {pid}")
+                    proc.kill()
+                
+                # Remove any stale PID files
+                for stale_file in (PID_FILE, STOP_FLAG_FILE):
+                    try:
+                        os.unlink(stale_file)
+                    except FileNotFoundError:
+                        pass
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
     except Exception as e:
@@ -529,8 +1008,10 @@ def main():
     def signal_handler(signum, frame):
         logger.info(f"Received signal {signum}")
         if signum == signal.SIGHUP:
-            logger.info("Reloading configuration...")
-            manager.reload_config()
+            # Don't reload inline: the main thread may already hold the
+            # reload lock (e.g. during the initial start)
+            logger.info("Scheduling configuration reload...")
+            manager.request_reload()
         else:
             logger.info("Shutting down...")
             manager.stop()
@@ -543,24 +1024,10 @@ def main():
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGHUP, signal_handler)
     else:  # Windows
-        # Windows doesn't support SIGHUP, so we'll use a different approach
+        # Windows doesn't support SIGHUP: reloads are requested by creating
+        # RELOAD_FLAG_FILE, which the config watcher picks up
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
-        # For Windows, we'll use a file-based approach for config reload
-        def check_config_reload():
-            while True:
-                if os.path.exists(os.path.expanduser("~/.rclone/scs_reload_flag")):
-                    try:
-                        os.remove(os.path.expanduser("~/.rclone/scs_reload_flag"))
-                        logger.info("Reloading configuration...")
-                        manager.reload_config()
-                    except Exception as e:
-                        logger.error(f"Error handling config reload: {e}")
-                time.sleep(1)
-        
-        # Start config reload checker thread
-        reload_thread = threading.Thread(target=check_config_reload, daemon=True)
-        reload_thread.start()
     
     # Save PID
     save_pid()
@@ -571,9 +1038,14 @@ def main():
     manager.start()
     
     try:
-        # Keep the main thread alive
-        while True:
-            time.sleep(1)
+        # Keep the main thread alive. Signal handlers do all the work, so on
+        # POSIX block until a signal arrives instead of waking every second
+        if hasattr(signal, 'pause'):
+            while True:
+                signal.pause()
+        else:  # Windows
+            while True:
+                time.sleep(1)
     except KeyboardInterrupt:
         manager.stop()
         remove_pid()
@@ -1,3 +1,250 @@
 """
 Sync module for Secure Cloud Syncer
-""" 
\ No newline at end of file
+"""
+
+import os
+import re
+import shutil
+import logging
+import threading
+import subprocess
+import configparser
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
+
+# Default directory for the sync logs and rclone's own logs
+LOG_DIR = os.path.expanduser("~/.rclone/logs")
+
+# Directory holding the generated rclone exclude files
+EXCLUDE_FILE_DIR = os.path.expanduser("~/.rclone")
+# Exclude file names, indexed by whether resource forks are excluded: the
+# bidirectional and one-way syncs share one pattern set, the monitor has its own
+SYNC_EXCLUDE_FILES = ("scs_excludes.txt", "scs_excludes_forks.txt")
+MONITOR_EXCLUDE_FILES = ("scs_monitor_excludes.txt", "scs_monitor_excludes_forks.txt")
+
+RCLONE_VERSION_RE = re.compile(r"rclone v((\d+)\.(\d+)\.\d+)")
+
+# rclone binary (path and mtime) that last passed the version check; a
+# failed check is retried on the next call, and replacing the binary
+# invalidates a passed one
+_rclone_checked = None
+
+logger = logging.getLogger("secure_cloud_syncer.sync")
+
+# An encrypted rclone.conf has no sections, only a comment header and this
+# marker line followed by the encrypted data
+RCLONE_ENCRYPTED_CONFIG_RE = re.compile(r"^RCLONE_ENCRYPT_V\d+:", re.MULTILINE)
+
+def find_rclone_config_file():
+    """
+    Locate rclone's config file using rclone's own search order.
+    
+    Returns:
+        str: Path to the config file, or None if there is none
+    """
+    if os.environ.get('RCLONE_CONFIG'):
+        return os.environ['RCLONE_CONFIG']
+    
+    candidates = []
+    if os.name == 'nt' and os.environ.get('APPDATA'):
+        candidates.append(os.path.join(os.environ['APPDATA'], 'rclone', 'rclone.conf'))
+    xdg_config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+    candidates.append(os.path.join(xdg_config_home, 'rclone', 'rclone.conf'))
+    candidates.append(os.path.expanduser('~/.rclone.conf'))
+    
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+def read_remote_config(remote, fallback=False):
+    """
+    Read the settings of an rclone remote straight from rclone.conf.
+    
+    Args:
+        remote (str): Name of the remote
+        fallback (bool): Ask 'rclone config show' instead when rclone.conf
+            cannot be found, read or is encrypted
+    
+    Returns:
+        dict: The remote's settings, or None if the remote is not configured
+        or its settings cannot be read
+    """
+    parser = configparser.ConfigParser(interpolation=None, strict=False)
+    config_file = find_rclone_config_file()
+    
+    try:
+        if config_file is None:
+            raise FileNotFoundError("rclone config file not found")
+        with open(config_file, 'r') as f:
+            content = f.read()
+        if RCLONE_ENCRYPTED_CONFIG_RE.search(content):
+            raise ValueError("rclone config is encrypted")
+        parser.read_string(content)
+    except (OSError, ValueError, configparser.Error):
+        if not fallback:
+            return None
+        result = subprocess.run(['rclone', 'config', 'show', remote],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        try:
+            parser.read_string(result.stdout)
+        except configparser.Error:
+            return None
+    
+    if not parser.has_section(remote):
+        return None
+    return dict(parser.items(remote))
+
+def _rclone_binary_key():
+    path = shutil.which("rclone")
+    if path is None:
+        return None
+    try:
+        return (path, os.stat(path).st_mtime)
+    except OSError:
+        return None
+
+def check_rclone_version():
+    """
+    Check if rclone version is 1.58.0 or newer (required for bisync).
+    
+    Returns:
+        bool: True if version is sufficient, False otherwise
+    """
+    global _rclone_checked
+    key = _rclone_binary_key()
+    if key is not None and key == _rclone_checked:
+        return True
+    
+    try:
+        result = subprocess.run(["rclone", "version"], capture_output=True, text=True, check=True)
+        version_match = RCLONE_VERSION_RE.search(result.stdout)
+        if version_match:
+            version = version_match.group(1)
+            major, minor = int(version_match.group(2)), int(version_match.group(3))
+            if major > 1 or (major == 1 and minor >= 58):
+                _rclone_checked = key
+                return True
+            logger.error(f"rclone version {version} is older than 1.58.0 which is required for bisync")
+            return False
+        logger.error("Could not determine rclone version")
+        return False
+    except subprocess.CalledProcessError:
+        logger.error("Failed to run rclone version command")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error checking rclone version: {e}")
+        return False
+
+def exclude_file_content(patterns):
+    """
+    Get exclude patterns in rclone's --exclude-from file format.
+    
+    Args:
+        patterns (tuple): Exclude patterns as rclone arguments
+        
+    Returns:
+        str: One pattern per line
+    """
+    # Every other element of the argument tuple is a pattern. rclone matches
+    # a pattern not starting with / below any directory, so a **/ prefix
+    # only narrows it to exclude the top level, and the two forms collapse
+    patterns = dict.fromkeys(p[3:] if p.startswith("**/") else p for p in patterns[1::2])
+    return "\n".join(patterns) + "\n"
+
+def write_exclude_file(patterns, name):
+    """
+    Write exclude patterns to a file for rclone's --exclude-from.
+    
+    The file is only rewritten when its contents would change, so tasks,
+    restarts and repeated syncs reuse it as is.
+    
+    Args:
+        patterns (tuple): Exclude patterns as rclone arguments
+        name (str): File name in EXCLUDE_FILE_DIR
+        
+    Returns:
+        str: Path to the exclude file
+    """
+    content = exclude_file_content(patterns)
+    path = os.path.join(EXCLUDE_FILE_DIR, name)
+    
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return path
+    except FileNotFoundError:
+        os.makedirs(EXCLUDE_FILE_DIR, exist_ok=True)
+    
+    # Write to a temporary file and rename it so a running sync never reads
+    # a partial pattern list; tasks start on several threads at once, so the
+    # temporary name includes the thread
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+    return path
+
+@lru_cache(maxsize=8)
+def ensure_log_dir(log_file):
+    """
+    Create the directory holding a log file, once per log file.
+    
+    Args:
+        log_file (str): Path to the log file
+    """
+    os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+
+def run_rclone(cmd, log):
+    """
+    Run an rclone command to completion.
+    
+    rclone writes its log to --log-file; whatever it reports on stderr (e.g.
+    startup errors) is streamed into our log as it arrives instead of
+    blocking until exit. stdout carries nothing we use.
+    
+    Args:
+        cmd (sequence): The rclone command
+        log (logging.Logger): Logger receiving rclone's stderr
+        
+    Raises:
+        subprocess.CalledProcessError: If rclone exits with an error
+    """
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Running command: %s", ' '.join(cmd))
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               text=True, bufsize=1)
+    for line in process.stderr:
+        log.info("rclone: %s", line.rstrip())
+    returncode = process.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+def setup_logging(log_name):
+    """
+    Configure logging to the console and a rotating file in LOG_DIR.
+    
+    Only done when a sync module runs as a script: importing one must not
+    install handlers (or open log files) in the importing process.
+    
+    Args:
+        log_name (str): Log file name in LOG_DIR
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(),
+            # Rotate like the service's own logs; delay opens the file on
+            # the first record rather than up front
+            RotatingFileHandler(
+                os.path.join(LOG_DIR, log_name),
+                maxBytes=10*1024*1024,  # 10MB
+                backupCount=5,
+                delay=True
+            )
+        ]
+    )
@@ -8,92 +8,60 @@ import os
 import sys
 import logging
 import subprocess
-import re
-from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.expanduser("~/.rclone/bidirectional_sync.log"))
-    ]
-)
+from . import (LOG_DIR, SYNC_EXCLUDE_FILES, check_rclone_version, write_exclude_file,
+               ensure_log_dir, run_rclone, setup_logging)
+
 logger = logging.getLogger("secure_cloud_syncer.bidirectional")
 
-def check_rclone_version():
-    """
-    Check if rclone version is 1.58.0 or newer for bisync support.
-    
-    Returns:
-        bool: True if rclone version is 1.58.0 or newer, False otherwise
-    """
-    try:
-        result = subprocess.run(["rclone", "version"], capture_output=True, text=True, check=True)
-        version_match = re.search(r'rclone v(\d+\.\d+\.\d+)', result.stdout)
-        if version_match:
-            version = version_match.group(1)
-            major, minor, patch = map(int, version.split('.'))
-            if major > 1 or (major == 1 and minor > 57):
-                return True
-            logger.error(f"rclone version {version} is older than 1.58.0 which is required for bisync")
-            return False
-        logger.error("Could not determine rclone version")
-        return False
-    except subprocess.CalledProcessError:
-        logger.error("Failed to run rclone version command")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error checking rclone version: {e}")
-        return False
+# rclone arguments excluding macOS metadata files, built once at import
+EXCLUDE_PATTERNS = (
+    "--exclude", ".DS_Store",
+    "--exclude", ".DS_Store/**",
+    "--exclude", "**/.DS_Store",
+    "--exclude", ".Trash/**",
+    "--exclude", "**/.Trash/**",
+    "--exclude", ".localized",
+    "--exclude", "**/.localized",
+    "--exclude", ".Spotlight-V100",
+    "--exclude", "**/.Spotlight-V100/**",
+    "--exclude", ".fseventsd",
+    "--exclude", "**/.fseventsd/**",
+    "--exclude", ".TemporaryItems",
+    "--exclude", "**/.TemporaryItems/**",
+    "--exclude", ".VolumeIcon.icns",
+    "--exclude", "**/.VolumeIcon.icns",
+    "--exclude", ".DocumentRevisions-V100",
+    "--exclude", "**/.DocumentRevisions-V100/**",
+    "--exclude", ".com.apple.timemachine.donotpresent",
+    "--exclude", "**/.com.apple.timemachine.donotpresent",
+    "--exclude", ".AppleDouble",
+    "--exclude", "**/.AppleDouble/**",
+    "--exclude", ".LSOverride",
+    "--exclude", "**/.LSOverride/**",
+    "--exclude", "Icon?",
+    "--exclude", "**/Icon?",
+)
+# The same, also excluding macOS resource fork files (._*)
+EXCLUDE_PATTERNS_RESOURCE_FORKS = EXCLUDE_PATTERNS + (
+    "--exclude", "._*",
+    "--exclude", "**/._*",
+)
 
 def build_exclude_patterns(exclude_resource_forks=False):
     """
-    Build the exclude patterns for rclone.
+    Get the exclude patterns for rclone.
     
     Args:
         exclude_resource_forks (bool): Whether to exclude macOS resource fork files
         
     Returns:
-        str: The exclude patterns as a string
+        tuple: The exclude patterns as rclone arguments
     """
-    exclude_patterns = [
-        "--exclude", ".DS_Store",
-        "--exclude", ".DS_Store/**",
-        "--exclude", "**/.DS_Store",
-        "--exclude", ".Trash/**",
-        "--exclude", "**/.Trash/**",
-        "--exclude", ".localized",
-        "--exclude", "**/.localized",
-        "--exclude", ".Spotlight-V100",
-        "--exclude", "**/.Spotlight-V100/**",
-        "--exclude", ".fseventsd",
-        "--exclude", "**/.fseventsd/**",
-        "--exclude", ".TemporaryItems",
-        "--exclude", "**/.TemporaryItems/**",
-        "--exclude", ".VolumeIcon.icns",
-        "--exclude", "**/.VolumeIcon.icns",
-        "--exclude", ".DocumentRevisions-V100",
-        "--exclude", "**/.DocumentRevisions-V100/**",
-        "--exclude", ".com.apple.timemachine.donotpresent",
-        "--exclude", "**/.com.apple.timemachine.donotpresent",
-        "--exclude", ".AppleDouble",
-        "--exclude", "**/.AppleDouble/**",
-        "--exclude", ".LSOverride",
-        "--exclude", "**/.LSOverride/**",
-        "--exclude", "Icon?",
-        "--exclude", "**/Icon?"
-    ]
-    
     if exclude_resource_forks:
-        exclude_patterns.extend([
-            "--exclude", "._*",
-            "--exclude", "**/._*"
-        ])
         logger.info("Excluding macOS resource fork files (._*)")
-    
-    return exclude_patterns
+        return EXCLUDE_PATTERNS_RESOURCE_FORKS
+    return EXCLUDE_PATTERNS
 
 def sync_bidirectional(local_dir, remote_dir="gdrive-crypt:", exclude_resource_forks=False, log_file=None):
     """
@@ -114,12 +82,11 @@ def sync_bidirectional(local_dir, remote_dir="gdrive-crypt:", exclude_resource_f
         return False
     
     # Validate inputs
-    local_path = Path(local_dir)
-    if not local_path.exists():
+    if not os.path.exists(local_dir):
         logger.error(f"Local directory does not exist: {local_dir}")
         return False
     
-    if not local_path.is_dir():
+    if not os.path.isdir(local_dir):
         logger.error(f"Local path is not a directory: {local_dir}")
         return False
     
@@ -129,14 +96,14 @@ def sync_bidirectional(local_dir, remote_dir="gdrive-crypt:", exclude_resource_f
     
     # Set default log file if not provided
     if log_file is None:
-        log_file = os.path.expanduser("~/.rclone/bidirectional_sync.log")
+        log_file = os.path.join(LOG_DIR, "bidirectional_sync.log")
     
     # Create log directory if it doesn't exist
-    log_path = Path(log_file).parent
-    log_path.mkdir(parents=True, exist_ok=True)
+    ensure_log_dir(log_file)
     
-    # Build the exclude patterns
-    exclude_patterns = build_exclude_patterns(exclude_resource_forks)
+    # Pass the exclude patterns as a file rather than dozens of arguments
+    exclude_file = write_exclude_file(build_exclude_patterns(exclude_resource_forks),
+                                      SYNC_EXCLUDE_FILES[bool(exclude_resource_forks)])
     
     # Build the rclone bisync command
     cmd = [
@@ -150,15 +117,14 @@ def sync_bidirectional(local_dir, remote_dir="gdrive-crypt:", exclude_resource_f
     ]
     
     # Add exclude patterns
-    cmd.extend(exclude_patterns)
+    cmd.extend(["--exclude-from", exclude_file])
     
     # Log the start of the sync
     logger.info(f"Starting bidirectional sync between {local_dir} and {remote_dir}")
     
     try:
         # Run the sync command
-        logger.debug(f"Running command: {' '.join(cmd)}")
-        subprocess.run(cmd, check=True)
+        run_rclone(cmd, logger)
         logger.info("Bidirectional sync completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -172,6 +138,8 @@ def main():
     """
     Main entry point for the bidirectional sync script.
     """
+    setup_logging("bidirectional_sync.log")
+    
     if len(sys.argv) < 2:
         print("Usage: python bidirectional.py <local_directory> [--exclude-resource-forks]")
         sys.exit(1)
@@ -8,93 +8,150 @@ import os
 import sys
 import time
 import logging
+import threading
 import subprocess
 import re
+import signal
+import fnmatch
+import tempfile
+import hashlib
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
-def check_rclone_version():
+from . import (LOG_DIR, MONITOR_EXCLUDE_FILES, read_remote_config, check_rclone_version, exclude_file_content,
+               write_exclude_file, run_rclone)
+
+# Markers for local/remote pairs that bisync has listings for, so that a
+# restarted task can skip --resync
+BISYNC_STATE_DIR = os.path.expanduser("~/.rclone/scs_bisync")
+
+# Longest time in seconds a sync waits for changes to settle
+MAX_SYNC_DELAY = 60
+# Event types for file accesses that don't modify anything ("closed_no_write"
+# is only reported by watchdog 4.0 and later)
+READ_ONLY_EVENT_TYPES = frozenset(('opened', 'closed_no_write'))
+# Temporary and hidden files that never trigger a sync: editor backups (~)
+# and dotfiles everywhere, plus temp files and Office lock files (~$) on Windows
+if os.name == 'nt':
+    IGNORED_SUFFIXES = ('~', '.tmp', '.temp')
+    IGNORED_PREFIXES = ('.', '~$')
+else:
+    IGNORED_SUFFIXES = ('~',)
+    IGNORED_PREFIXES = ('.',)
+
+# rclone arguments excluding macOS and Windows metadata files, built once at import
+EXCLUDE_PATTERNS = (
+    "--exclude", ".DS_Store",
+    "--exclude", ".DS_Store/**",
+    "--exclude", "**/.DS_Store",
+    "--exclude", ".Trash/**",
+    "--exclude", "**/.Trash/**",
+    "--exclude", ".localized",
+    "--exclude", "**/.localized",
+    "--exclude", ".Spotlight-V100",
+    "--exclude", "**/.Spotlight-V100/**",
+    "--exclude", ".fseventsd",
+    "--exclude", "**/.fseventsd/**",
+    "--exclude", ".TemporaryItems",
+    "--exclude", "**/.TemporaryItems/**",
+    "--exclude", ".VolumeIcon.icns",
+    "--exclude", "**/.VolumeIcon.icns",
+    "--exclude", ".DocumentRevisions-V100",
+    "--exclude", "**/.DocumentRevisions-V100/**",
+    "--exclude", ".com.apple.timemachine.donotpresent",
+    "--exclude", "**/.com.apple.timemachine.donotpresent",
+    "--exclude", ".AppleDouble",
+    "--exclude", "**/.AppleDouble/**",
+    "--exclude", ".LSOverride",
+    "--exclude", "**/.LSOverride/**",
+    "--exclude", "Icon?",
+    "--exclude", "**/Icon?",
+    # Windows specific patterns
+    "--exclude", "Thumbs.db",
+    "--exclude", "**/Thumbs.db",
+    "--exclude", "desktop.ini",
+    "--exclude", "**/desktop.ini",
+    "--exclude", "$RECYCLE.BIN/**",
+    "--exclude", "**/$RECYCLE.BIN/**",
+    "--exclude", "*.lnk",
+    "--exclude", "**/*.lnk",
+)
+# The same, also excluding macOS resource fork files (._*)
+EXCLUDE_PATTERNS_RESOURCE_FORKS = EXCLUDE_PATTERNS + (
+    "--exclude", "._*",
+    "--exclude", "**/._*",
+)
+
+def build_excluded_path_re(patterns):
     """
-    Check if rclone version is 1.58.0 or newer (required for bisync).
+    Compile exclude patterns into one regex over paths relative to the
+    monitored directory.
+    
+    Like rclone, a pattern not starting with / matches below any directory.
     
+    Args:
+        patterns (tuple): Exclude patterns as rclone arguments
+        
     Returns:
-        bool: True if version is sufficient, False otherwise
+        re.Pattern: Regex matching the excluded paths
     """
-    logger = logging.getLogger("secure_cloud_syncer.monitor")
-    try:
-        result = subprocess.run(
-            ["rclone", "version"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        version_match = re.search(r"rclone v(\d+\.\d+\.\d+)", result.stdout)
-        if version_match:
-            version = version_match.group(1)
-            major, minor, patch = map(int, version.split('.'))
-            if major > 1 or (major == 1 and minor >= 58):
-                return True
-        logger.error("rclone version 1.58.0 or newer is required for bisync")
-        return False
-    except Exception as e:
-        logger.error(f"Error checking rclone version: {e}")
-        return False
+    globs = dict.fromkeys(p[3:] if p.startswith("**/") else p for p in patterns[1::2])
+    return re.compile('|'.join('(?:.*/)?' + fnmatch.translate(p) for p in globs))
+
+# Changes to excluded files don't trigger a sync at all, so the patterns are
+# compiled once at import for each pattern set
+EXCLUDED_PATH_RE = build_excluded_path_re(EXCLUDE_PATTERNS)
+EXCLUDED_PATH_RE_RESOURCE_FORKS = build_excluded_path_re(EXCLUDE_PATTERNS_RESOURCE_FORKS)
+
+# rclone options for bidirectional syncs, built once at import
+BISYNC_OPTIONS = (
+    "--transfers", "6",
+    "--checkers", "8",
+    "--contimeout", "60s",
+    "--timeout", "300s",
+    "--retries", "3",
+    "--low-level-retries", "10",
+    "--stats-one-line",
+    "--stats", "10s",
+    "--buffer-size", "64M",
+    "--use-mmap",
+    "--multi-thread-cutoff", "100M",
+    "--multi-thread-streams", "4",
+    "--fast-list",
+    "--no-update-modtime",
+)
+# rclone options for one-way uploads
+UPLOAD_OPTIONS = (
+    "--transfers", "8",
+    "--checkers", "16",
+    "--contimeout", "60s",
+    "--timeout", "300s",
+    "--retries", "3",
+    "--retries-sleep", "10s",
+    "--low-level-retries", "10",
+    "--stats-one-line",
+    "--stats", "5s",
+    "--buffer-size", "256M",
+    "--use-mmap",
+    "--multi-thread-cutoff", "100M",
+    "--multi-thread-streams", "4",
+    "--fast-list",
+    "--checksum",
+    "--no-update-modtime",
+)
 
 def build_exclude_patterns(exclude_resource_forks=False):
     """
-    Build the exclude patterns for rclone.
+    Get the exclude patterns for rclone.
     
     Args:
         exclude_resource_forks (bool): Whether to exclude macOS resource fork files
         
     Returns:
-        list: List of exclude patterns
+        tuple: Exclude patterns as rclone arguments
     """
-    patterns = [
-        "--exclude", ".DS_Store",
-        "--exclude", ".DS_Store/**",
-        "--exclude", "**/.DS_Store",
-        "--exclude", ".Trash/**",
-        "--exclude", "**/.Trash/**",
-        "--exclude", ".localized",
-        "--exclude", "**/.localized",
-        "--exclude", ".Spotlight-V100",
-        "--exclude", "**/.Spotlight-V100/**",
-        "--exclude", ".fseventsd",
-        "--exclude", "**/.fseventsd/**",
-        "--exclude", ".TemporaryItems",
-        "--exclude", "**/.TemporaryItems/**",
-        "--exclude", ".VolumeIcon.icns",
-        "--exclude", "**/.VolumeIcon.icns",
-        "--exclude", ".DocumentRevisions-V100",
-        "--exclude", "**/.DocumentRevisions-V100/**",
-        "--exclude", ".com.apple.timemachine.donotpresent",
-        "--exclude", "**/.com.apple.timemachine.donotpresent",
-        "--exclude", ".AppleDouble",
-        "--exclude", "**/.AppleDouble/**",
-        "--exclude", ".LSOverride",
-        "--exclude", "**/.LSOverride/**",
-        "--exclude", "Icon?",
-        "--exclude", "**/Icon?",
-        # Windows specific patterns
-        "--exclude", "Thumbs.db",
-        "--exclude", "**/Thumbs.db",
-        "--exclude", "desktop.ini",
-        "--exclude", "**/desktop.ini",
-        "--exclude", "$RECYCLE.BIN/**",
-        "--exclude", "**/$RECYCLE.BIN/**",
-        "--exclude", "*.lnk",
-        "--exclude", "**/*.lnk"
-    ]
-    
-    if exclude_resource_forks:
-        patterns.extend([
-            "--exclude", "._*",
-            "--exclude", "**/._*"
-        ])
-    
-    return patterns
+    return EXCLUDE_PATTERNS_RESOURCE_FORKS if exclude_resource_forks else EXCLUDE_PATTERNS
 
 class ChangeHandler(FileSystemEventHandler):
     """
@@ -113,30 +170,71 @@ class ChangeHandler(FileSystemEventHandler):
             direction (str): Sync direction - "bidirectional" or "upload"
         """
         self.local_dir = os.path.normpath(local_dir)
+        # Event paths start with the watched path, so the path relative to
+        # it is whatever follows this prefix
+        self._local_prefix = os.path.join(self.local_dir, '')
         self.remote_dir = remote_dir
         self.exclude_resource_forks = exclude_resource_forks
         self.debounce_time = debounce_time
         self.log_file = log_file
         self.direction = direction
-        self.last_sync = 0
         self.sync_pending = False
         self.sync_in_progress = False
+        # Set once the handler is stopped; no sync starts after that
+        self.stopped = False
+        # Guards sync_pending/sync_in_progress/stopped, which the debounce
+        # timer threads and the initial sync update concurrently
+        self._state_lock = threading.Lock()
+        # Notified when sync_in_progress is cleared
+        self._sync_done = threading.Condition(self._state_lock)
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        self._burst_start = 0
+        self._last_sync_end = 0
+        # Upload mode only copies the files that changed since the last sync
+        # (relative paths), unless something was deleted or moved, or the last
+        # sync failed, in which case the whole tree is synced
+        self._changed_paths = set()
+        self._full_sync_needed = False
         self.exclude_patterns = build_exclude_patterns(exclude_resource_forks)
+        self._excluded_path_re = EXCLUDED_PATH_RE_RESOURCE_FORKS if exclude_resource_forks else EXCLUDED_PATH_RE
         self.logger = logging.getLogger("secure_cloud_syncer.monitor.handler")
+        # Pass the exclude patterns as a file rather than dozens of arguments
+        exclude_file_name = MONITOR_EXCLUDE_FILES[bool(exclude_resource_forks)]
+        try:
+            exclude_args = ("--exclude-from", write_exclude_file(self.exclude_patterns, exclude_file_name))
+        except OSError as e:
+            self.logger.warning(f"Could not write exclude file, passing patterns as arguments: {e}")
+            exclude_args = self.exclude_patterns
+        self._exclude_args = exclude_args
+        # Nothing in the rclone command changes between syncs, so build it once
+        if direction == "bidirectional":
+            # bisync must --resync after its filters change, so they are part
+            # of the key
+            pair = "\0".join((self.local_dir, remote_dir,
+                              exclude_file_content(self.exclude_patterns))).encode()
+            self._bisync_marker = os.path.join(BISYNC_STATE_DIR,
+                                               hashlib.blake2b(pair, digest_size=16).hexdigest())
+            self._command = ("rclone", "bisync", self.local_dir, remote_dir,
+                             "--verbose", "--log-file", log_file,
+                             *BISYNC_OPTIONS, *exclude_args)
+        else:  # upload
+            self._command = ("rclone", "sync", self.local_dir, remote_dir,
+                             "--verbose", "--log-file", log_file,
+                             *UPLOAD_OPTIONS, *exclude_args)
         self.initial_sync_done = False
         
         # Check encryption settings
-        try:
-            result = subprocess.run(['rclone', 'config', 'show', remote_dir.split(':')[0]], 
-                                  capture_output=True, text=True, check=True)
-            if 'type = crypt' in result.stdout:
-                filename_enc = 'standard' if 'filename_encryption = standard' in result.stdout else 'off'
-                dir_enc = 'true' if 'directory_name_encryption = true' in result.stdout else 'false'
-                self.logger.info(f"Using encrypted remote with settings:")
-                self.logger.info(f"- Filename encryption: {filename_enc}")
-                self.logger.info(f"- Directory name encryption: {dir_enc}")
-        except Exception as e:
-            self.logger.warning(f"Could not verify encryption settings: {e}")
+        settings = read_remote_config(remote_dir.split(':')[0])
+        if settings is None:
+            self.logger.debug("Could not read the remote's settings from rclone.conf")
+        elif settings.get('type') == 'crypt':
+            # rclone leaves settings at their defaults out of the config file
+            filename_enc = settings.get('filename_encryption', 'standard')
+            dir_enc = settings.get('directory_name_encryption', 'true')
+            self.logger.info(f"Using encrypted remote with settings:")
+            self.logger.info(f"- Filename encryption: {filename_enc}")
+            self.logger.info(f"- Directory name encryption: {dir_enc}")
         
         # Perform initial sync
         self.logger.info("Performing initial sync...")
@@ -151,44 +249,151 @@ class ChangeHandler(FileSystemEventHandler):
         Args:
             event: The file system event
         """
-        if event.is_directory:
-            return
+        # A directory deleted or moved out of the tree gets no events for the
+        # files inside it, and copying changed files never deletes anything
+        if (event.is_directory and self.direction == "upload"
+                and event.event_type in ('deleted', 'moved')):
+            with self._state_lock:
+                self._full_sync_needed = True
         
-        # Skip temporary files and hidden files
-        if event.src_path.endswith('~') or os.path.basename(event.src_path).startswith('.'):
+        # Opening or reading a file (including rclone reading it during a
+        # sync) changes nothing, and other directory events are covered by
+        # the events for the files inside them
+        if event.is_directory or event.event_type in READ_ONLY_EVENT_TYPES:
             return
         
         # Check if the file is in the monitored directory
-        try:
-            rel_path = os.path.relpath(event.src_path, self.local_dir)
-            if rel_path.startswith('..'):
-                return
-        except ValueError:
+        path = event.src_path
+        if not path.startswith(self._local_prefix):
             return
+        rel_path = path[len(self._local_prefix):]
         
-        # Skip Windows-specific temporary files
-        if os.name == 'nt':
-            if event.src_path.endswith('.tmp') or event.src_path.endswith('.temp'):
-                return
-            if '~$' in event.src_path:  # Office temporary files
-                return
+        # Skip files rclone excludes anyway, such as anything in a .Trash folder
+        if os.sep != '/':
+            rel_path = rel_path.replace(os.sep, '/')
+        if self._excluded_path_re.match(rel_path):
+            return
+        
+        # Record the change before the filter below: rclone still uploads
+        # temporary and hidden files, they just don't trigger a sync
+        if self.direction == "upload":
+            with self._state_lock:
+                if event.event_type in ('created', 'modified', 'closed'):
+                    self._changed_paths.add(rel_path)
+                else:
+                    self._full_sync_needed = True
         
-        current_time = time.time()
-        if current_time - self.last_sync < self.debounce_time:
-            self.sync_pending = True
+        # Temporary files and hidden files don't trigger a sync; test the
+        # file name in place rather than splitting it off the path
+        if path.endswith(IGNORED_SUFFIXES) or path.startswith(IGNORED_PREFIXES, path.rfind(os.sep) + 1):
             return
         
-        self.sync_pending = False
-        self.last_sync = current_time
+        self._schedule_sync()
+    
+    def _schedule_sync(self):
+        # A change after a quiet period (no sync in the last debounce_time)
+        # is synced right away, since a single save is the common case.
+        # Otherwise debounce on the trailing edge: every event restarts the
+        # timer, so a burst of changes (e.g. an editor saving many files)
+        # results in one sync once the directory has been quiet for
+        # debounce_time. A burst that never goes quiet is still synced
+        # MAX_SYNC_DELAY after it started
+        now = time.monotonic()
+        with self._timer_lock:
+            if self.stopped:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+                delay = None
+            else:
+                self._burst_start = now
+                quiet = (not self.sync_in_progress
+                         and now - self._last_sync_end >= self.debounce_time)
+                delay = 0 if quiet else None
+            if delay is None:
+                deadline = self._burst_start + max(MAX_SYNC_DELAY, self.debounce_time)
+                delay = min(self.debounce_time, max(0, deadline - now))
+            self._timer = threading.Timer(delay, self._debounced_sync)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _debounced_sync(self):
+        with self._timer_lock:
+            self._timer = None
         
         # If a sync is already in progress, mark as pending and return
-        if self.sync_in_progress:
-            self.sync_pending = True
-            self.logger.info("Sync in progress, changes will be synced after current sync completes")
-            return
+        with self._state_lock:
+            if self.stopped:
+                return
+            if self.sync_in_progress:
+                self.sync_pending = True
+                self.logger.info("Sync in progress, changes will be synced after current sync completes")
+                return
         
         self.sync_directory(initial_sync=False)
     
+    def stop(self):
+        """
+        Stop starting syncs and cancel one waiting for the debounce period to end.
+        
+        Call this once no more events can be dispatched to the handler (i.e.
+        after its observer has been joined), so nothing re-arms the timer.
+        A sync that is already running is left to finish; see wait_for_sync.
+        """
+        with self._state_lock:
+            self.stopped = True
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+    
+    def wait_for_sync(self, timeout=None):
+        """
+        Wait for a running sync to finish.
+        
+        Args:
+            timeout (float): Seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            bool: True if no sync is running, False if the timeout expired
+        """
+        with self._sync_done:
+            return self._sync_done.wait_for(lambda: not self.sync_in_progress, timeout)
+    
+    def _write_files_from(self, paths):
+        """
+        Write paths to a temporary file for rclone's --files-from option.
+        
+        Args:
+            paths (set): Paths relative to the monitored directory
+            
+        Returns:
+            str: Path to the temporary file
+        """
+        with tempfile.NamedTemporaryFile('w', prefix='scs_changed_', suffix='.lst',
+                                         delete=False) as f:
+            f.write('\n'.join(sorted(paths)))
+            f.write('\n')
+        return f.name
+    
+    def _take_changes(self, initial_sync):
+        """
+        Claim the changes the next sync covers; call with _state_lock held.
+        
+        Args:
+            initial_sync (bool): Whether this is the initial sync
+            
+        Returns:
+            tuple: (full_sync, changed_paths), or None if an upload sync would
+            have nothing to copy
+        """
+        changed_paths, self._changed_paths = self._changed_paths, set()
+        full_sync = initial_sync or self._full_sync_needed
+        if self.direction == "upload" and not full_sync and not changed_paths:
+            return None
+        self._full_sync_needed = False
+        return full_sync, changed_paths
+    
     def sync_directory(self, initial_sync=False):
         """
         Perform a sync using rclone based on the configured direction.
@@ -196,91 +401,104 @@ class ChangeHandler(FileSystemEventHandler):
         Args:
             initial_sync (bool): Whether this is the initial sync
         """
-        if self.sync_in_progress:
-            self.logger.warning("Sync already in progress, skipping")
-            return
+        with self._state_lock:
+            if self.stopped:
+                return
+            if self.sync_in_progress:
+                self.logger.warning("Sync already in progress, skipping")
+                return
+            changes = self._take_changes(initial_sync)
+            if changes is None:
+                self.logger.debug("No changes left to upload, skipping")
+                return
+            self.sync_in_progress = True
+        
+        # Keep syncing while changes arrive during a sync. sync_in_progress
+        # stays set until the last run, so no other sync can start in between
+        while True:
+            succeeded = self._run_sync(initial_sync, *changes)
+            self._last_sync_end = time.monotonic()
+            with self._state_lock:
+                if not succeeded:
+                    self._full_sync_needed = True
+                changes = None
+                if self.sync_pending and not self.stopped:
+                    self.sync_pending = False
+                    changes = self._take_changes(False)
+                if changes is None:
+                    self.sync_in_progress = False
+                    self._sync_done.notify_all()
+                    return
+            initial_sync = False
+            self.logger.info("Changes occurred during sync, starting another sync")
+    
+    def _run_sync(self, initial_sync, full_sync, changed_paths):
+        """
+        Run rclone once.
         
-        self.sync_in_progress = True
+        Args:
+            initial_sync (bool): Whether this is the initial sync
+            full_sync (bool): Whether to sync the whole tree in upload mode
+            changed_paths (set): Changed paths to copy if not syncing the whole tree
+            
+        Returns:
+            bool: True if the sync succeeded, False otherwise
+        """
+        files_from = None
+        resync = False
         try:
+            cmd = self._command
             if self.direction == "bidirectional":
-                # Build the rclone bisync command
-                cmd = [
-                    "rclone",
-                    "bisync",
-                    self.local_dir,
-                    self.remote_dir,
-                    "--verbose",
-                    "--log-file", self.log_file,
-                    "--transfers", "6",
-                    "--checkers", "8",
-                    "--contimeout", "60s",
-                    "--timeout", "300s",
-                    "--retries", "3",
-                    "--low-level-retries", "10",
-                    "--stats-one-line",
-                    "--stats", "10s",
-                    "--buffer-size", "64M",
-                    "--multi-thread-cutoff", "100M",
-                    "--multi-thread-streams", "4",
-                    "--fast-list",
-                    "--no-update-modtime"
-                ]
-                
-                # Only add --resync for initial sync
-                if initial_sync:
-                    cmd.insert(4, "--resync")
+                # --resync (re)builds bisync's listings from scratch, so only the
+                # first sync of a local/remote pair needs it
+                if initial_sync and not os.path.exists(self._bisync_marker):
+                    resync = True
+                    cmd = cmd[:4] + ("--resync",) + cmd[4:]
                     self.logger.info(f"Starting initial bidirectional sync between {self.local_dir} and {self.remote_dir}")
                 else:
                     self.logger.info(f"Starting bidirectional sync between {self.local_dir} and {self.remote_dir}")
-            else:  # upload
-                # Build the rclone sync command for one-way upload
-                cmd = [
-                    "rclone",
-                    "sync",
-                    self.local_dir,
-                    self.remote_dir,
-                    "--verbose",
-                    "--log-file", self.log_file,
-                    "--transfers", "8",
-                    "--checkers", "16",
-                    "--contimeout", "60s",
-                    "--timeout", "300s",
-                    "--retries", "3",
-                    "--low-level-retries", "10",
-                    "--progress",
-                    "--stats-one-line",
-                    "--stats", "5s",
-                    "--buffer-size", "256M",
-                    "--multi-thread-cutoff", "100M",
-                    "--multi-thread-streams", "4",
-                    "--fast-list",
-                    "--checksum",
-                    "--no-update-modtime"
-                ]
+            elif full_sync:  # upload
                 self.logger.info(f"Starting one-way sync from {self.local_dir} to {self.remote_dir}")
+            else:
+                # Copy just the changed files instead of comparing the whole
+                # tree with the remote
+                files_from = self._write_files_from(changed_paths)
+                cmd = ("rclone", "copy", self.local_dir, self.remote_dir,
+                       "--files-from", files_from, "--no-traverse",
+                       "--verbose", "--log-file", self.log_file,
+                       *UPLOAD_OPTIONS, *self._exclude_args)
+                self.logger.info(f"Uploading {len(changed_paths)} changed file(s) from {self.local_dir} to {self.remote_dir}")
             
-            # Add exclude patterns
-            cmd.extend(self.exclude_patterns)
-            
-            try:
-                # Run the sync command
-                self.logger.debug(f"Running command: {' '.join(cmd)}")
-                subprocess.run(cmd, check=True)
-                self.logger.info("Sync completed successfully")
-            except subprocess.CalledProcessError as e:
-                self.logger.error(f"Error during sync: {e}")
-            except Exception as e:
-                self.logger.error(f"Unexpected error during sync: {e}")
-            
-            # Check if we need to run another sync due to pending changes
-            if self.sync_pending:
-                self.logger.info("Changes occurred during sync, starting another sync")
-                self.sync_pending = False
-                self.sync_in_progress = False
-                self.sync_directory(initial_sync=False)
-            
+            # Run the sync command
+            run_rclone(cmd, self.logger)
+            self.logger.info("Sync completed successfully")
+            if resync:
+                try:
+                    os.makedirs(BISYNC_STATE_DIR, exist_ok=True)
+                    open(self._bisync_marker, 'w').close()
+                except OSError as e:
+                    self.logger.warning(f"Could not record bisync state: {e}")
+            return True
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Error during sync: {e}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error during sync: {e}")
         finally:
-            self.sync_in_progress = False
+            if files_from is not None:
+                try:
+                    os.unlink(files_from)
+                except OSError:
+                    pass
+        
+        # bisync's listings may be gone or damaged, so fall back to --resync
+        if self.direction == "bidirectional" and initial_sync and not resync:
+            self.logger.info("Bidirectional sync failed, retrying with --resync")
+            try:
+                os.unlink(self._bisync_marker)
+            except OSError:
+                pass
+            return self._run_sync(initial_sync, full_sync, changed_paths)
+        return False
 
 def start_monitoring(local_dir, remote_dir="gdrive-crypt:", exclude_resource_forks=False, debounce_time=5, log_file=None, direction="bidirectional"):
     """
@@ -300,10 +518,12 @@ def start_monitoring(local_dir, remote_dir="gdrive-crypt:", exclude_resource_for
     logger = logging.getLogger("secure_cloud_syncer.monitor")
     
     try:
-        # Set up log file path
+        # Set up log file path; rclone runs without a shell, so resolve it here
         if log_file is None:
-            log_dir = os.path.expanduser("~/.rclone")
-            log_file = os.path.join(log_dir, "scs_monitor_rsync.log")
+            os.makedirs(LOG_DIR, exist_ok=True)
+            log_file = os.path.join(LOG_DIR, "scs_monitor_rsync.log")
+        else:
+            log_file = os.path.abspath(os.path.expanduser(log_file))
         
         logger.info(f"Starting monitoring for {local_dir}")
         
@@ -339,7 +559,9 @@ def start_monitoring(local_dir, remote_dir="gdrive-crypt:", exclude_resource_for
         
         # Create and start observer
         observer = Observer()
-        observer.schedule(event_handler, local_dir, recursive=True)
+        observer.schedule(event_handler, event_handler.local_dir, recursive=True)
+        # Keep a handle on the handler so callers can adjust it in place
+        observer.event_handler = event_handler
         observer.start()
         
         logger.info(f"Started monitoring {local_dir}")
@@ -377,8 +599,14 @@ def main():
     )
     
     try:
-        while True:
-            time.sleep(1)
+        # The observer and debounce timers do all the work, so on POSIX block
+        # until a signal arrives instead of waking every second
+        if hasattr(signal, 'pause'):
+            while True:
+                signal.pause()
+        else:  # Windows
+            while True:
+                time.sleep(1)
     except KeyboardInterrupt:
         observer.stop()
         observer.join()
@@ -7,104 +7,159 @@ This module provides functionality for syncing files from a local directory to G
 import os
 import sys
 import logging
+import stat
 import subprocess
-from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.expanduser("~/.rclone/sync.log"))
-    ]
-)
+from . import LOG_DIR, SYNC_EXCLUDE_FILES, write_exclude_file, ensure_log_dir, run_rclone, setup_logging
+
 logger = logging.getLogger("secure_cloud_syncer.one_way")
 
+# rclone options for each way of deciding whether a file changed. Checking
+# size and modification time is rclone's default; size-only skips reading
+# modification times (extra metadata per file on some remotes) but misses
+# edits that keep the size, and crypt remotes have no checksums to compare
+COMPARE_MODE_OPTIONS = {
+    "modtime": (),
+    "size-only": ("--size-only",),
+    "checksum": ("--checksum",),
+}
+
+# rclone arguments excluding macOS metadata files, built once at import
+EXCLUDE_PATTERNS = (
+    "--exclude", ".DS_Store",
+    "--exclude", ".DS_Store/**",
+    "--exclude", "**/.DS_Store",
+    "--exclude", ".Trash/**",
+    "--exclude", "**/.Trash/**",
+    "--exclude", ".localized",
+    "--exclude", "**/.localized",
+    "--exclude", ".Spotlight-V100",
+    "--exclude", "**/.Spotlight-V100/**",
+    "--exclude", ".fseventsd",
+    "--exclude", "**/.fseventsd/**",
+    "--exclude", ".TemporaryItems",
+    "--exclude", "**/.TemporaryItems/**",
+    "--exclude", ".VolumeIcon.icns",
+    "--exclude", "**/.VolumeIcon.icns",
+    "--exclude", ".DocumentRevisions-V100",
+    "--exclude", "**/.DocumentRevisions-V100/**",
+    "--exclude", ".com.apple.timemachine.donotpresent",
+    "--exclude", "**/.com.apple.timemachine.donotpresent",
+    "--exclude", ".AppleDouble",
+    "--exclude", "**/.AppleDouble/**",
+    "--exclude", ".LSOverride",
+    "--exclude", "**/.LSOverride/**",
+    "--exclude", "Icon?",
+    "--exclude", "**/Icon?",
+)
+# The same, also excluding macOS resource fork files (._*)
+EXCLUDE_PATTERNS_RESOURCE_FORKS = EXCLUDE_PATTERNS + (
+    "--exclude", "._*",
+    "--exclude", "**/._*",
+)
+
 def build_exclude_patterns(exclude_resource_forks=False):
     """
-    Build the exclude patterns for rclone.
+    Get the exclude patterns for rclone.
     
     Args:
         exclude_resource_forks (bool): Whether to exclude macOS resource fork files
         
     Returns:
-        list: The exclude patterns as a list of arguments
+        tuple: The exclude patterns as rclone arguments
     """
-    exclude_patterns = [
-        "--exclude", ".DS_Store",
-        "--exclude", ".DS_Store/**",
-        "--exclude", "**/.DS_Store",
-        "--exclude", ".Trash/**",
-        "--exclude", "**/.Trash/**",
-        "--exclude", ".localized",
-        "--exclude", "**/.localized",
-        "--exclude", ".Spotlight-V100",
-        "--exclude", "**/.Spotlight-V100/**",
-        "--exclude", ".fseventsd",
-        "--exclude", "**/.fseventsd/**",
-        "--exclude", ".TemporaryItems",
-        "--exclude", "**/.TemporaryItems/**",
-        "--exclude", ".VolumeIcon.icns",
-        "--exclude", "**/.VolumeIcon.icns",
-        "--exclude", ".DocumentRevisions-V100",
-        "--exclude", "**/.DocumentRevisions-V100/**",
-        "--exclude", ".com.apple.timemachine.donotpresent",
-        "--exclude", "**/.com.apple.timemachine.donotpresent",
-        "--exclude", ".AppleDouble",
-        "--exclude", "**/.AppleDouble/**",
-        "--exclude", ".LSOverride",
-        "--exclude", "**/.LSOverride/**",
-        "--exclude", "Icon?",
-        "--exclude", "**/Icon?"
-    ]
-    
     if exclude_resource_forks:
-        exclude_patterns.extend([
-            "--exclude", "._*",
-            "--exclude", "**/._*"
-        ])
         logger.info("Excluding macOS resource fork files (._*)")
+        return EXCLUDE_PATTERNS_RESOURCE_FORKS
+    return EXCLUDE_PATTERNS
+
+def is_rotational(path):
+    """
+    Check whether a path lives on a spinning disk.
+    
+    Only Linux reports this (through sysfs); elsewhere the disk is assumed
+    to be an SSD.
     
-    return exclude_patterns
+    Args:
+        path (str): Path on the disk to check
+        
+    Returns:
+        bool: True if the disk is rotational, False otherwise
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        st_dev = os.stat(path).st_dev
+    except OSError:
+        return False
+    device = f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}"
+    # A partition has no queue of its own; its parent disk does
+    for queue in (os.path.join(device, "queue"), os.path.join(device, "..", "queue")):
+        try:
+            with open(os.path.join(queue, "rotational")) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return False
 
-def sync_directory(local_dir, remote_dir="gdrive_encrypted:", exclude_resource_forks=False, log_file=None):
+def build_sync_command(local_dir, remote_dir="gdrive_encrypted:", exclude_resource_forks=False, log_file=None,
+                       transfers=8, checkers=None, buffer_size="32M", compare_mode="modtime"):
     """
-    Perform a one-way sync from a local directory to Google Drive using rclone sync.
+    Validate the local directory and build the rclone command syncing it.
+    
+    Also creates the log directory and the exclude file the command uses.
     
     Args:
         local_dir (str): Path to the local directory to sync
         remote_dir (str): Remote directory to sync with
         exclude_resource_forks (bool): Whether to exclude macOS resource fork files
         log_file (str): Path to the log file
+        transfers (int): Number of files to transfer in parallel
+        checkers (int): Number of files to check in parallel; defaults to 2 on
+            a spinning disk, where parallel reads only cause seeking, and 16 otherwise
+        buffer_size (str): Read-ahead buffer per transfer, in rclone's size format
+        compare_mode (str): How rclone decides a file changed - "modtime" (size
+            and modification time), "size-only" or "checksum"
         
     Returns:
-        bool: True if sync was successful, False otherwise
+        list: The rclone command, or None if the local directory is unusable
     """
-    # Validate inputs
-    local_path = Path(local_dir)
-    if not local_path.exists():
+    if compare_mode not in COMPARE_MODE_OPTIONS:
+        logger.error(f"Unknown compare mode: {compare_mode}")
+        return None
+    
+    # Validate inputs; one stat answers both existence and type
+    try:
+        st = os.stat(local_dir)
+    except FileNotFoundError:
         logger.error(f"Local directory does not exist: {local_dir}")
-        return False
+        return None
+    except OSError as e:
+        logger.error(f"Cannot access local directory {local_dir}: {e}")
+        return None
     
-    if not local_path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         logger.error(f"Local path is not a directory: {local_dir}")
-        return False
+        return None
     
     if not os.access(local_dir, os.R_OK):
         logger.error(f"Local directory is not readable: {local_dir}")
-        return False
+        return None
     
     # Set default log file if not provided
     if log_file is None:
-        log_file = os.path.expanduser("~/.rclone/sync.log")
+        log_file = os.path.join(LOG_DIR, "sync.log")
     
     # Create log directory if it doesn't exist
-    log_path = Path(log_file).parent
-    log_path.mkdir(parents=True, exist_ok=True)
+    ensure_log_dir(log_file)
+    
+    # Pass the exclude patterns as a file rather than dozens of arguments;
+    # they match bidirectional.py's, so the two share the file
+    exclude_file = write_exclude_file(build_exclude_patterns(exclude_resource_forks),
+                                      SYNC_EXCLUDE_FILES[bool(exclude_resource_forks)])
     
-    # Build the exclude patterns
-    exclude_patterns = build_exclude_patterns(exclude_resource_forks)
+    if checkers is None:
+        checkers = 2 if is_rotational(local_dir) else 16
     
     # Build the rclone sync command
     cmd = [
@@ -114,27 +169,59 @@ def sync_directory(local_dir, remote_dir="gdrive_encrypted:", exclude_resource_f
         remote_dir,
         "--verbose",
         "--log-file", log_file,
-        "--transfers", "4",
-        "--checkers", "8",
+        "--transfers", str(transfers),
+        "--checkers", str(checkers),
+        "--fast-list",
+        # Buffers come from mmap, so rclone hands them back to the OS as soon
+        # as a transfer finishes instead of keeping them on its heap
+        "--use-mmap",
+        "--buffer-size", buffer_size,
         "--contimeout", "60s",
         "--timeout", "300s",
         "--retries", "3",
+        # Give a flaky connection time to recover before a retry walks the
+        # whole tree again
+        "--retries-sleep", "10s",
         "--low-level-retries", "10",
-        "--progress",
         "--stats-one-line",
         "--stats", "5s"
     ]
     
     # Add exclude patterns
-    cmd.extend(exclude_patterns)
+    cmd.extend(["--exclude-from", exclude_file])
+    cmd.extend(COMPARE_MODE_OPTIONS[compare_mode])
+    
+    return cmd
+
+def sync_directory(local_dir, remote_dir="gdrive_encrypted:", exclude_resource_forks=False, log_file=None,
+                   transfers=8, checkers=None, buffer_size="32M", compare_mode="modtime"):
+    """
+    Perform a one-way sync from a local directory to Google Drive using rclone sync.
+    
+    Args:
+        local_dir (str): Path to the local directory to sync
+        remote_dir (str): Remote directory to sync with
+        exclude_resource_forks (bool): Whether to exclude macOS resource fork files
+        log_file (str): Path to the log file
+        transfers (int): Number of files to transfer in parallel
+        checkers (int): Number of files to check in parallel; chosen for the disk if not given
+        buffer_size (str): Read-ahead buffer per transfer, in rclone's size format
+        compare_mode (str): "modtime", "size-only" or "checksum"
+        
+    Returns:
+        bool: True if sync was successful, False otherwise
+    """
+    cmd = build_sync_command(local_dir, remote_dir, exclude_resource_forks, log_file,
+                             transfers, checkers, buffer_size, compare_mode)
+    if cmd is None:
+        return False
     
     # Log the start of the sync
     logger.info(f"Starting one-way sync from {local_dir} to {remote_dir}")
     
     try:
         # Run the sync command
-        logger.debug(f"Running command: {' '.join(cmd)}")
-        subprocess.run(cmd, check=True)
+        run_rclone(cmd, logger)
         logger.info("One-way sync completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -148,14 +235,52 @@ def main():
     """
     Main entry point for the one-way sync script.
     """
+    setup_logging("sync.log")
+    
     if len(sys.argv) < 2:
-        print("Usage: python one_way.py <local_directory> [--exclude-resource-forks]")
+        print("Usage: python one_way.py <local_directory> [--exclude-resource-forks] "
+              "[--transfers <count>] [--checkers <count>] "
+              "[--compare modtime|size-only|checksum] [--exec]")
         sys.exit(1)
     
     local_dir = sys.argv[1]
     exclude_resource_forks = "--exclude-resource-forks" in sys.argv
+    transfers = 8
+    checkers = None
+    compare_mode = "modtime"
+    
+    # Parse transfer and checker counts if provided
+    if "--transfers" in sys.argv:
+        try:
+            transfers = int(sys.argv[sys.argv.index("--transfers") + 1])
+        except (ValueError, IndexError):
+            print("Invalid transfer count. Using default value of 8.")
+    if "--checkers" in sys.argv:
+        try:
+            checkers = int(sys.argv[sys.argv.index("--checkers") + 1])
+        except (ValueError, IndexError):
+            print("Invalid checker count. Choosing one for the disk.")
+    if "--compare" in sys.argv:
+        compare_index = sys.argv.index("--compare")
+        if compare_index + 1 < len(sys.argv) and sys.argv[compare_index + 1] in COMPARE_MODE_OPTIONS:
+            compare_mode = sys.argv[compare_index + 1]
+        else:
+            print("Invalid compare mode. Using modtime.")
+    
+    # With --exec, rclone replaces this process instead of running under it,
+    # so the interpreter doesn't stay resident for the whole sync; rclone's
+    # exit status becomes the script's and its errors go to the terminal
+    if "--exec" in sys.argv:
+        cmd = build_sync_command(local_dir, exclude_resource_forks=exclude_resource_forks,
+                                 transfers=transfers, checkers=checkers, compare_mode=compare_mode)
+        if cmd is None:
+            sys.exit(1)
+        logger.info(f"Starting one-way sync from {local_dir} (rclone replaces this process)")
+        logging.shutdown()
+        os.execvp(cmd[0], cmd)
     
-    success = sync_directory(local_dir, exclude_resource_forks=exclude_resource_forks)
+    success = sync_directory(local_dir, exclude_resource_forks=exclude_resource_forks,
+                             transfers=transfers, checkers=checkers, compare_mode=compare_mode)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
@@ -6,18 +6,23 @@ This script handles the installation of the package and its dependencies.
 
 import os
 import sys
+import shutil
 import subprocess
-from setuptools import setup, find_packages
+from setuptools import setup
 from setuptools.command.develop import develop
 from setuptools.command.install import install
 from pathlib import Path
 
 def check_rclone():
     """Check if rclone binary is installed."""
+    # Don't start a process when rclone isn't on PATH at all
+    if shutil.which('rclone') is None:
+        return False
     try:
-        subprocess.run(['rclone', 'version'], capture_output=True, check=True)
+        subprocess.run(['rclone', 'version'], capture_output=True, check=True,
+                       stdin=subprocess.DEVNULL, timeout=10)
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
 def install_service():
@@ -26,6 +31,12 @@ def install_service():
     if service_script.exists():
         subprocess.run(['bash', str(service_script)], check=True)
 
+def read_long_description():
+    """Read README.md from next to this script, closing the file afterwards."""
+    readme = Path(__file__).parent / "README.md"
+    with open(readme, encoding="utf-8") as f:
+        return f.read()
+
 class PostDevelopCommand(develop):
     def run(self):
         develop.run(self)
@@ -39,12 +50,16 @@ class PostInstallCommand(install):
 setup(
     name="secure-cloud-syncer",
     version="0.1.0",
-    packages=find_packages(),
+    # Listed rather than found, so setuptools doesn't walk the rest of the
+    # tree (including the bundled rclone release) looking for packages
+    packages=["secure_cloud_syncer", "secure_cloud_syncer.sync"],
     install_requires=[
         "watchdog>=2.1.0",
         "psutil>=5.9.0",
-        "rclone>=0.1.0",  # Python wrapper for rclone
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],  # Faster config parsing
+    },
     entry_points={
         "console_scripts": [
             "scs=secure_cloud_syncer.cli:main",
@@ -63,7 +78,7 @@ setup(
     author="Konstantin Schmidt",
     author_email="konsti7@gmx.net",
     description="A secure cloud syncing tool with encryption and monitoring",
-    long_description=open("README.md").read(),
+    long_description=read_long_description(),
     long_description_content_type="text/markdown",
     url="https://github.com/crystalnet/secure-cloud-syncer",
     classifiers=[